@@ -1,7 +1,35 @@
 # file: dashboard/log_console.py
+import html
+import time
+from collections import deque
 from PyQt6.QtWidgets import QPlainTextEdit
-from PyQt6.QtGui import QColor, QTextCharFormat, QFont
-from PyQt6.QtCore import QDateTime
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QTimer
+
+# Maximum number of lines kept in the console; older lines are discarded
+MAX_LOG_LINES = 5000
+# Pending lines are coalesced and painted at most once per interval
+FLUSH_INTERVAL_MS = 50
+
+# Level -> (color, icon). Unknown levels are rendered as INFO.
+_LEVELS = {
+    "SUCCESS": ("#2ecc71", "✔"), # Green
+    "ERROR": ("#e74c3c", "✖"), # Red
+    "WARN": ("#f39c12", "⚠"), # Yellow
+    "INFO": ("#3498db", "ℹ"), # Blue
+}
+_MESSAGE_COLOR = "#abb2bf" # Standard text color
+
+def _make_fmt(level, color, icon):
+    """Pre-renders the HTML around the timestamp and message for one level."""
+    return (
+        f'<span style="color:{color}">[',
+        f'] {icon} [{level}]: </span><span style="color:{_MESSAGE_COLOR}">',
+    )
+
+# Built once at import so log_message only fills in the timestamp and message
+_FORMATS = {level: _make_fmt(level, color, icon) for level, (color, icon) in _LEVELS.items()}
+_MSG_CLOSE = "</span>"
 
 class SecurityLogConsole(QPlainTextEdit):
     def __init__(self, parent=None):
@@ -9,38 +37,62 @@ class SecurityLogConsole(QPlainTextEdit):
         self.setObjectName("logConsole")
         self.setReadOnly(True)
         self.setFont(QFont("Courier New", 10))
+        # Turns the document into a ring buffer so memory stays bounded
+        self.setMaximumBlockCount(MAX_LOG_LINES)
+        self.setCenterOnScroll(True)
+
+        self._pending = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
         self.log_message("INFO", "Security Log Console Initialized.")
 
     def log_message(self, level, message):
-        timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
-        
-        if level.upper() == "SUCCESS":
-            color = QColor("#2ecc71") # Green
-            level_icon = "✔"
-        elif level.upper() == "ERROR":
-            color = QColor("#e74c3c") # Red
-            level_icon = "✖"
-        elif level.upper() == "WARN":
-            color = QColor("#f39c12") # Yellow
-            level_icon = "⚠"
-        else: # INFO
-            color = QColor("#3498db") # Blue
-            level_icon = "ℹ"
-
-        log_format = QTextCharFormat()
-        log_format.setForeground(color)
-
-        cursor = self.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        
-        # Insert Timestamp
-        cursor.insertText(f"[{timestamp}] ", log_format)
-        
-        # Insert Level
-        cursor.insertText(f"{level_icon} [{level.upper()}]: ", log_format)
-
-        # Insert Message
-        log_format.setForeground(QColor("#abb2bf")) # Standard text color
-        cursor.insertText(message + "\n", log_format)
-        
-        self.ensureCursorVisible()
\ No newline at end of file
+        """
+        Queues a log line. Lines are painted in batches by _flush, so this must be
+        called from the GUI thread; worker threads should post to it with a queued
+        QMetaObject.invokeMethod call.
+        """
+        self._enqueue(level, message)
+        # Only the first line of a burst arms the timer
+        if len(self._pending) == 1:
+            self._flush_timer.start()
+
+    def log_many(self, entries):
+        """
+        Logs several (level, message) pairs for one user action and paints them
+        immediately in a single pass.
+        """
+        for level, message in entries:
+            self._enqueue(level, message)
+        self._flush_timer.stop()
+        self._flush()
+
+    def _enqueue(self, level, message):
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        level = level.upper()
+        try:
+            before_ts, before_msg = _FORMATS[level]
+        except KeyError:
+            # Unknown levels keep their own label but use the INFO style; remembered for next time
+            before_ts, before_msg = _FORMATS[level] = _make_fmt(level, *_LEVELS["INFO"])
+
+        # appendHtml would fold embedded newlines into spaces; keep them as line breaks
+        text = html.escape(message).replace("\n", "<br>")
+        self._pending.append(before_ts + timestamp + before_msg + text + _MSG_CLOSE)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        lines = list(self._pending)
+        self._pending.clear()
+        # Repaint once for the whole batch; appendHtml keeps the view pinned to
+        # the bottom when it already was, so no explicit scroll is needed
+        self.setUpdatesEnabled(False)
+        try:
+            # One paragraph per line keeps one document block per log line
+            self.appendHtml("<p>" + "</p><p>".join(lines) + "</p>")
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,7 +1,6 @@
-# file: dashboard/main_app_window.py
-
-from PyQt6.QtWidgets import QMainWindow
-from dashboard.main_window import MainAppTab
+from PyQt6.QtWidgets import QMainWindow, QSplitter
+from PyQt6.QtCore import Qt
+from dashboard.log_console import SecurityLogConsole
 
 class MainAppWindow(QMainWindow):
     def __init__(self):
@@ -9,8 +8,24 @@ class MainAppWindow(QMainWindow):
         self.setWindowTitle("UR Safe Stick - User Vault")
         self.setGeometry(100, 100, 950, 680)
 
-        # Create an instance of our main application widget
-        self.main_app_widget = MainAppTab()
+        # Shared security log; the vault tab reports its status here
+        self.log_console = SecurityLogConsole()
+        # The main application widget is built on first show (see showEvent)
+        self.main_app_widget = None
+
+    def showEvent(self, event):
+        if self.main_app_widget is None:
+            # Imported here so the vault UI and SDK stay off the startup import path
+            from dashboard.main_window import MainAppTab
+            # Create an instance of our main application widget
+            self.main_app_widget = MainAppTab(log_console=self.log_console)
 
-        # Set it as the central widget for this window
-        self.setCentralWidget(self.main_app_widget)
\ No newline at end of file
+            # Vault UI on top, security log underneath
+            splitter = QSplitter(Qt.Orientation.Vertical)
+            splitter.addWidget(self.main_app_widget)
+            splitter.addWidget(self.log_console)
+            splitter.setStretchFactor(0, 4)
+            splitter.setStretchFactor(1, 1)
+            # Set it as the central widget for this window
+            self.setCentralWidget(splitter)
+        super().showEvent(event)
@@ -2,6 +2,12 @@
 
 import os
 import sys
+import ctypes
+import shutil
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to Python path so we can import ursafe_sdk
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -11,17 +17,113 @@ if project_root not in sys.path:
 from PyQt6.QtWidgets import (
     # --- CHANGE 1: QMainWindow is no longer needed here ---
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QComboBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMessageBox, QDialog, QDialogButtonBox,
-    QFormLayout
+    QLabel, QLineEdit, QPushButton, QComboBox, QTableView,
+    QHeaderView, QMessageBox, QDialog, QDialogButtonBox,
+    QFormLayout, QStyledItemDelegate, QProgressBar, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon, QPixmap, QPainter
+from PyQt6.QtCore import (
+    Qt, QTimer, QEvent, QAbstractTableModel, QModelIndex, QObject, QAbstractNativeEventFilter,
+    QCoreApplication, QThread, QMetaObject, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QIcon, QPixmap, QPixmapCache, QPainter
 from PyQt6.QtSvg import QSvgRenderer
 
-from ursafe_sdk.usb_manager import find_usb_drives, verify_stick
-from ursafe_sdk.log_manager import add_log_entry
-from ursafe_sdk.vault_manager import VaultManager
+# Only the drive scan is needed at startup; the vault stack (vault_manager and
+# chunk_manager) is imported by the handlers that use it
+from ursafe_sdk.usb_manager import verify_stick
+from dashboard.utils import drive_cache
+
+# pyudev is only needed for hotplug notifications on Linux
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+# How long a drive enumeration is reused before re-scanning (seconds)
+DRIVE_CACHE_TTL = 2.0
+# Refresh requests (button clicks, hotplug bursts) within this window of the first collapse into one scan
+REFRESH_DEBOUNCE_MS = 150
+# Drive polling interval without OS hotplug notifications, and the safety-net interval with them
+USB_POLL_MS = 2000
+USB_FALLBACK_POLL_MS = 30000
+# Follow-up scan after a hotplug event, since mounting lags behind the device event
+USB_SETTLE_MS = 1500
+# How often a pending disconnect alert checks whether the open message box has been closed
+DISCONNECT_ALERT_RETRY_MS = 250
+
+# Windows device-change notifications (see WM_DEVICECHANGE in winuser.h / dbt.h)
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+@lru_cache(maxsize=64)
+def _darken_color(hex_color, factor=0.2):
+    value = int(hex_color.lstrip('#'), 16)
+    scale = 1 - factor
+    r = int(((value >> 16) & 0xff) * scale)
+    g = int(((value >> 8) & 0xff) * scale)
+    b = int((value & 0xff) * scale)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+# Action buttons (by object name) for each base color
+_BUTTON_COLORS = {
+    "#4CAF50": ("initButton", "addSecretButton"),
+    "#2196F3": ("unlockButton", "lockButton"),
+    "#757575": ("refreshButton",),
+    "#f44336": ("deleteDataButton",),
+}
+
+def _button_rules(base_color, names):
+    """QSS rules for the buttons with the given object names, derived from one base color."""
+    def sel(state=""):
+        return ", ".join(f"QPushButton#{name}{state}" for name in names)
+    d1 = _darken_color(base_color, 0.1)
+    d3 = _darken_color(base_color, 0.3)
+    d4 = _darken_color(base_color, 0.4)
+    return f"""
+            {sel()} {{ background-color: {base_color}; color: white; font-weight: bold; font-size: 12px; padding: 10px 20px; border: 2px solid {base_color}; border-radius: 6px; min-height: 20px; }}
+            {sel(":hover")} {{ background-color: {d1}; border: 2px solid {d3}; }}
+            {sel(":pressed")} {{ background-color: {d3}; border: 2px solid {d4}; }}
+            {sel(":disabled")} {{ background-color: #e0e0e0; color: #9e9e9e; border: 2px solid #cccccc; }}
+        """
+
+@lru_cache(maxsize=1)
+def _tab_stylesheet():
+    """The main tab's stylesheet, built once and shared by every MainAppTab."""
+    return "".join(_button_rules(color, names) for color, names in _BUTTON_COLORS.items())
+
+@lru_cache(maxsize=None)
+def _svg_renderer(path):
+    """Parsed SVG per file, so rendering another size skips the XML parse."""
+    return QSvgRenderer(path)
+
+@lru_cache(maxsize=32)
+def _svg_icon(path, width, height):
+    """
+    Renders an SVG file to a shared QIcon, keyed by absolute path and size. A missing
+    file gives a null icon (also cached); render errors propagate and are not cached.
+    """
+    if not os.path.exists(path):
+        return QIcon()
+    # Rasterized pixels live in Qt's shared, size-bounded pixmap cache
+    pixmap_key = f"{path}@{width}x{height}"
+    pixmap = QPixmapCache.find(pixmap_key)
+    if pixmap is None:
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        _svg_renderer(path).render(painter)
+        painter.end()
+        QPixmapCache.insert(pixmap_key, pixmap)
+    return QIcon(pixmap)
+
+def _dir_nonempty(path):
+    """True if path is a directory with at least one entry; stops at the first one."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
 
 # All dialog classes (SimplePinDialog, PinDialog, SecretDialog) remain exactly the same
 # ... (Their code is included below for completeness)
@@ -48,6 +150,11 @@ class SimplePinDialog(QDialog):
     def get_pin(self):
         return self.pin_input.text()
 
+    def reset(self):
+        """Clears the field so the dialog can be shown again."""
+        self.pin_input.clear()
+        self.pin_input.setFocus()
+
 class PinDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -67,6 +174,12 @@ class PinDialog(QDialog):
         main_layout.addWidget(button_box)
         self.setLayout(main_layout)
 
+    def reset(self):
+        """Clears both fields so the dialog can be shown again."""
+        self.pin_input.clear()
+        self.confirm_pin_input.clear()
+        self.pin_input.setFocus()
+
     def get_pin(self):
         pin1 = self.pin_input.text()
         pin2 = self.confirm_pin_input.text()
@@ -96,6 +209,13 @@ class SecretDialog(QDialog):
         main_layout.addWidget(button_box)
         self.setLayout(main_layout)
 
+    def reset(self):
+        """Clears all fields so the dialog can be shown again."""
+        self.label_input.clear()
+        self.username_input.clear()
+        self.password_input.clear()
+        self.label_input.setFocus()
+
     def get_data(self):
         if self.label_input.text():
             return {
@@ -105,16 +225,322 @@ class SecretDialog(QDialog):
             }
         return None
 
+# One vault entry; a named tuple keeps rows as compact as plain tuples (no per-row __dict__)
+Secret = namedtuple("Secret", ("label", "username", "password"))
+
+class SecretsModel(QAbstractTableModel):
+    """
+    Lightweight table model backing the secrets view.
+    Rows are stored as Secret records (slot-free named tuples); the view only
+    queries the cells it actually paints. Large vaults are exposed to the view
+    PAGE_SIZE rows at a time as the user scrolls (canFetchMore/fetchMore), while
+    _rows always holds every secret so saving never misses unviewed rows.
+    """
+    HEADERS = ("Label", "Username", "Password", "Actions")
+    EDITABLE_COLUMNS = 3
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._loaded = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Only answer display/edit queries; every other role falls back to the view defaults
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole) and index.column() < self.EDITABLE_COLUMNS:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == self.EDITABLE_COLUMNS:
+            return "Delete this secret"
+        return None
+
+    def flags(self, index):
+        if index.column() < self.EDITABLE_COLUMNS:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() >= self.EDITABLE_COLUMNS:
+            return False
+        row = self._rows[index.row()]
+        self._rows[index.row()] = row._replace(**{row._fields[index.column()]: value})
+        self.dataChanged.emit(index, index)
+        return True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Exposes the next page of rows to the view."""
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def set_rows(self, rows):
+        """Replaces the contents with Secret records and exposes the first page."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        # First page goes out with the reset itself, so the view lays out once
+        self._loaded = min(self.PAGE_SIZE, len(self._rows))
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """Appends Secret records with a single insert notification."""
+        if not rows:
+            return
+        # New rows go at the end, so any rows not yet paged in are exposed along with them
+        first = self._loaded
+        self._rows.extend(rows)
+        self.beginInsertRows(QModelIndex(), first, len(self._rows) - 1)
+        self._loaded = len(self._rows)
+        self.endInsertRows()
+
+    def secret_at(self, row):
+        """Returns the Secret for a row."""
+        return self._rows[row]
+
+    def secrets(self):
+        """Returns every Secret, including rows not yet paged into the view."""
+        return self._rows
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._loaded -= 1
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._loaded = 0
+        self.endResetModel()
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """
+    Paints the trash icon in the Actions column and reports clicks, so the
+    table needs one delegate instead of a QPushButton per row.
+    """
+    delete_requested = pyqtSignal(int)
+    ICON_SIZE = 16
+
+    def __init__(self, icon, parent=None):
+        super().__init__(parent)
+        self._icon = icon
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        if not self._icon.isNull():
+            size = self.ICON_SIZE
+            rect = option.rect
+            self._icon.paint(painter, rect.x() + (rect.width() - size) // 2, rect.y() + (rect.height() - size) // 2, size, size)
+        else:
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, "🗑️")  # Fallback to emoji if SVG fails
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.delete_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+class _DeviceChangeFilter(QAbstractNativeEventFilter):
+    """Application-wide filter that reports WM_DEVICECHANGE arrivals/removals on Windows."""
+    def __init__(self, callback):
+        super().__init__()
+        self._callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == WM_DEVICECHANGE and msg.wParam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE):
+                self._callback()
+        return False, 0
+
+class UsbWatcher(QObject):
+    """
+    Emits drives_changed when the OS reports a storage device being added or removed.
+    Uses udev on Linux (if pyudev is installed) and WM_DEVICECHANGE on Windows.
+    """
+    drives_changed = pyqtSignal()
+    _IGNORED_DEVICES = ("loop", "ram", "dm-", "zram")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._observer = None
+        self._native_filter = None
+        # Why the hotplug monitor could not start, for the owner to report; None if it started
+        self.error = None
+        if sys.platform.startswith("linux") and pyudev is not None:
+            try:
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by(subsystem="block")
+                # The observer runs on its own thread; emitting a signal queues delivery to the GUI thread
+                self._observer = pyudev.MonitorObserver(monitor, callback=self._on_udev_event, name="ursafe-udev")
+                self._observer.daemon = True
+                self._observer.start()
+            except Exception as e:
+                self.error = str(e)
+                self._observer = None
+        elif sys.platform == "win32":
+            import ctypes.wintypes
+            self._native_filter = _DeviceChangeFilter(self.drives_changed.emit)
+            QCoreApplication.instance().installNativeEventFilter(self._native_filter)
+
+    @property
+    def is_active(self):
+        return self._observer is not None or self._native_filter is not None
+
+    def _on_udev_event(self, device):
+        # Loop (snaps, images), ram and device-mapper nodes are never removable sticks
+        if device.sys_name.startswith(self._IGNORED_DEVICES):
+            return
+        if device.action in ("add", "remove", "change"):
+            self.drives_changed.emit()
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        if self._native_filter is not None:
+            QCoreApplication.instance().removeNativeEventFilter(self._native_filter)
+            self._native_filter = None
+
+class UsbScanWorker(QObject):
+    """Runs the (shared, cached) drive scan on a background thread and reports the result."""
+    drives_ready = pyqtSignal(list)
+    # Reported separately so a failed scan is never mistaken for "no drives attached"
+    scan_failed = pyqtSignal(str)
+
+    @pyqtSlot()
+    def scan(self):
+        try:
+            drives = drive_cache.get_drives(DRIVE_CACHE_TTL)
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+            return
+        self.drives_ready.emit(drives)
+
+class VaultWorker(QObject):
+    """Runs the USB- and Argon2id-bound vault operations on a background thread."""
+    unlocked = pyqtSignal(object, object)  # vault_manager, vault_data
+    saved = pyqtSignal(int)  # number of secrets written
+    deleted = pyqtSignal(int)  # number of secrets in the removed vault
+    initialized = pyqtSignal(str)  # drive the new vault was created on
+    failed = pyqtSignal(str, str)  # operation ("verify"/"unlock"/"save"/"delete"/"initialize"), error message
+
+    @pyqtSlot(object, str)
+    def unlock(self, vault_manager, pin):
+        try:
+            # Reading meta.json can stall on a drive that is spinning up, so it is checked here too
+            verification = verify_stick(vault_manager.usb_path)
+            if not verification.get("valid", False):
+                self.failed.emit("verify", verification.get("reason", "Unknown"))
+                return
+            vault_data = vault_manager.unlock_vault(pin)
+        except Exception as e:
+            self.failed.emit("unlock", str(e))
+            return
+        self.unlocked.emit(vault_manager, vault_data)
+
+    @pyqtSlot(object, str, object)
+    def save(self, vault_manager, pin, vault_data):
+        try:
+            vault_manager.save_vault(pin, vault_data)
+        except Exception as e:
+            self.failed.emit("save", str(e))
+            return
+        self.saved.emit(len(vault_data))
+
+    @pyqtSlot(object, str)
+    def initialize(self, vault_manager, pin):
+        try:
+            vault_manager.initialize_vault(pin)
+            vault_manager.save_vault(pin, {})
+        except Exception as e:
+            self.failed.emit("initialize", str(e))
+            return
+        self.initialized.emit(vault_manager.usb_path)
+
+    @pyqtSlot(object, str)
+    def delete_data(self, vault_manager, pin):
+        try:
+            # The PIN is verified by a full unlock before anything is removed
+            secret_count = len(vault_manager.unlock_vault(pin))
+            from ursafe_sdk.chunk_manager import get_host_chunk_dir
+            targets = [path for path in (vault_manager.ursafe_dir, get_host_chunk_dir()) if os.path.exists(path)]
+            # USB and host directories are independent, so remove them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(shutil.rmtree, targets))
+        except Exception as e:
+            self.failed.emit("delete", str(e))
+            return
+        self.deleted.emit(secret_count)
+
 # --- CHANGE 2: The class now inherits from QWidget, not QMainWindow ---
 class MainAppTab(QWidget):
-    def __init__(self):
+    # Requests to the vault worker; queued across to its thread
+    _unlock_requested = pyqtSignal(object, str)
+    _save_requested = pyqtSignal(object, str, object)
+    _delete_requested = pyqtSignal(object, str)
+    _initialize_requested = pyqtSignal(object, str)
+
+    def __init__(self, log_console=None):
         super().__init__()
         # self.setWindowTitle(...) is removed, as tabs don't have titles
 
+        # Optional SecurityLogConsole; diagnostics fall back to stdout without one
+        self.log_console = log_console
         self.is_unlocked = False
         self.current_vault_manager = None
         self.current_pin = None
         self.current_usb_drive = None
+        self._scan_in_flight = False
+        # Enabled flags last applied by update_ui_state
+        self._ui_state = None
+        # Mountpoints currently listed in the drive combo
+        self._last_drive_set = frozenset()
+
+        # Drive enumeration runs on a worker thread so the event loop never blocks on it
+        self._scan_thread = QThread(self)
+        self._scan_worker = UsbScanWorker()
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_worker.drives_ready.connect(self._on_drives_ready)
+        self._scan_worker.scan_failed.connect(self._on_scan_failed)
+        self._scan_thread.start()
+
+        # Key derivation is deliberately slow, so unlock/save run on their own worker thread
+        self._vault_busy = False
+        self._pending_unlock = None
+        self._vault_thread = QThread(self)
+        self._vault_worker = VaultWorker()
+        self._vault_worker.moveToThread(self._vault_thread)
+        self._unlock_requested.connect(self._vault_worker.unlock)
+        self._save_requested.connect(self._vault_worker.save)
+        self._delete_requested.connect(self._vault_worker.delete_data)
+        self._initialize_requested.connect(self._vault_worker.initialize)
+        self._vault_worker.unlocked.connect(self._on_vault_unlocked)
+        self._vault_worker.saved.connect(self._on_vault_saved)
+        self._vault_worker.deleted.connect(self._on_vault_deleted)
+        self._vault_worker.initialized.connect(self._on_vault_initialized)
+        self._vault_worker.failed.connect(self._on_vault_failed)
+        self._vault_thread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self.shutdown_workers)
 
         # --- CHANGE 3: The layout is applied directly to 'self' (the QWidget) ---
         # self.central_widget is removed.
@@ -139,9 +565,9 @@ class MainAppTab(QWidget):
         self.init_button = QPushButton("Initialize New Stick")
         self.unlock_button = QPushButton("Unlock Vault")
         
-        self.apply_button_style(self.init_button, "#4CAF50")
-        self.apply_button_style(self.unlock_button, "#2196F3")
-        self.apply_button_style(self.refresh_button, "#757575")
+        self.init_button.setObjectName("initButton")
+        self.unlock_button.setObjectName("unlockButton")
+        self.refresh_button.setObjectName("refreshButton")
         
         self.action_layout.addWidget(self.pin_label)
         self.action_layout.addWidget(self.pin_input, 1)
@@ -149,15 +575,27 @@ class MainAppTab(QWidget):
         self.action_layout.addWidget(self.unlock_button)
         self.main_layout.addLayout(self.action_layout)
         
-        self.secrets_table = QTableWidget()
-        self.secrets_table.setColumnCount(4)
-        self.secrets_table.setHorizontalHeaderLabels(["Label", "Username", "Password", "Actions"])
+        self.secrets_table = QTableView()
+        self.secrets_model = SecretsModel(self)
+        self.secrets_table.setModel(self.secrets_model)
+        # One delegate draws every delete button; the row comes from the index, so it never goes stale
+        self.delete_delegate = DeleteButtonDelegate(self.load_svg_icon(os.path.join("assets", "trash.svg"), size=(16, 16)), self.secrets_table)
+        self.delete_delegate.delete_requested.connect(self.delete_secret_row)
+        self.secrets_table.setItemDelegateForColumn(3, self.delete_delegate)
         header = self.secrets_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        # Explicit widths set once; Stretch would recompute every column on each insertion
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        self.secrets_table.setColumnWidth(3, 50)
+        header.resizeSection(0, 200)
+        header.resizeSection(1, 250)
+        header.resizeSection(2, 250)
+        header.resizeSection(3, 50)
+        # Fixed row height so Qt never measures cell contents to size rows
+        vertical_header = self.secrets_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(32)
+        # Single-line cells: elide instead of wrapping, which would need a text layout per cell
+        self.secrets_table.setWordWrap(False)
         self.main_layout.addWidget(self.secrets_table, 1)
         
         self.status_label = QLabel("Ready - Select USB drive and initialize or unlock vault")
@@ -166,15 +604,25 @@ class MainAppTab(QWidget):
         """)
         self.status_label.setWordWrap(True)
         self.main_layout.addWidget(self.status_label)
+
+        # Indeterminate bar shown while a vault operation runs on the worker thread
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.setTextVisible(False)
+        self.busy_bar.setMaximumHeight(6)
+        self.busy_bar.hide()
+        self.main_layout.addWidget(self.busy_bar)
         
         self.bottom_action_layout = QHBoxLayout()
         self.delete_data_button = QPushButton(" Delete All Data")
         self.add_secret_button = QPushButton("Add New Secret")
         self.lock_button = QPushButton("Save & Lock Vault")
         
-        self.apply_button_style(self.delete_data_button, "#f44336")
-        self.apply_button_style(self.add_secret_button, "#4CAF50")
-        self.apply_button_style(self.lock_button, "#2196F3")
+        self.delete_data_button.setObjectName("deleteDataButton")
+        self.add_secret_button.setObjectName("addSecretButton")
+        self.lock_button.setObjectName("lockButton")
+        # All action button colors come from one stylesheet on the tab, parsed once
+        self.setStyleSheet(_tab_stylesheet())
         
         self.bottom_action_layout.addWidget(self.delete_data_button)
         self.bottom_action_layout.addStretch()
@@ -185,31 +633,56 @@ class MainAppTab(QWidget):
         self.init_button.clicked.connect(self.handle_initialize)
         self.unlock_button.clicked.connect(self.handle_unlock)
         self.lock_button.clicked.connect(self.handle_lock)
-        self.refresh_button.clicked.connect(self.populate_usb_drives)
+        self.refresh_button.clicked.connect(self.handle_refresh)
         self.add_secret_button.clicked.connect(self.handle_add_secret)
         self.delete_data_button.clicked.connect(self.handle_delete_data)
         
+        # VaultManager per drive path; dropped whenever the selected drive changes, and
+        # per drive when a scan no longer lists it (see _apply_drives)
+        self._vault_managers = {}
+        # Drives known to hold a vault; only positive results are kept, so a stale entry
+        # can never let Initialize overwrite a vault it did not see. Entries go when the
+        # selected drive changes or a scan no longer lists the drive
+        self._vaults_present = set()
+        self.usb_combo.currentTextChanged.connect(self.forget_vault_managers)
+
+        # Built on first use and then reused; reset() clears them after every use
+        self._pin_dlg = None
+        self._secret_dlg = None
+        self._verify_pin_dlg = None
+
         self.populate_usb_drives()
         self.setup_svg_icons()
         
-        self.usb_monitor_timer = QTimer()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # Re-enumerate as soon as the OS reports a device change, and once more after
+        # the desktop has had time to mount (or unmount) the partition
+        self.usb_watcher = UsbWatcher(self)
+        self.usb_watcher.drives_changed.connect(self._on_drives_changed)
+        if self.usb_watcher.error:
+            self.log("WARN", f"USB hotplug monitor unavailable: {self.usb_watcher.error}")
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(USB_SETTLE_MS)
+        self._settle_timer.timeout.connect(self.handle_refresh)
+
+        # With OS notifications the timer is only a safety net; without them it is the only source
+        self.usb_monitor_timer = QTimer(self)
         self.usb_monitor_timer.timeout.connect(self.check_usb_status)
-        self.usb_monitor_timer.start(2000)
+        self._monitor_pauses = 0
+        self.usb_monitor_timer.start(USB_FALLBACK_POLL_MS if self.usb_watcher.is_active else USB_POLL_MS)
 
     # All other methods (load_svg_icon, setup_svg_icons, handle_unlock, etc.) are IDENTICAL.
     # No changes are needed inside them. They are included here for completeness.
     def load_svg_icon(self, svg_path, size=(24, 24)):
         try:
-            if os.path.exists(svg_path):
-                renderer = QSvgRenderer(svg_path)
-                pixmap = QPixmap(size[0], size[1])
-                pixmap.fill(Qt.GlobalColor.transparent)
-                painter = QPainter(pixmap)
-                renderer.render(painter)
-                painter.end()
-                return QIcon(pixmap)
+            return _svg_icon(os.path.abspath(svg_path), size[0], size[1])
         except Exception as e:
-            print(f"Failed to load SVG {svg_path}: {e}")
+            self.log("WARN", f"Failed to load SVG {svg_path}: {e}")
         return QIcon()
 
     def setup_svg_icons(self):
@@ -223,43 +696,108 @@ class MainAppTab(QWidget):
             if not icon.isNull():
                 button.setIcon(icon)
 
-    def create_delete_button(self, row):
-        """Create a delete button with trash SVG icon"""
-        delete_btn = QPushButton()
-        delete_btn.setToolTip("Delete this secret")
-        # Load trash SVG icon
-        trash_icon = self.load_svg_icon(os.path.join("assets", "trash.svg"), size=(16, 16))
-        if not trash_icon.isNull():
-            delete_btn.setIcon(trash_icon)
+    def _vault_manager(self, drive):
+        """VaultManager for a drive, reused until the selected drive changes or the vault is emergency-locked."""
+        vault_manager = self._vault_managers.get(drive)
+        if vault_manager is None:
+            from ursafe_sdk.vault_manager import VaultManager
+            vault_manager = self._vault_managers[drive] = VaultManager(drive)
+        return vault_manager
+
+    def forget_vault_managers(self, *_):
+        self._vault_managers.clear()
+        self._vaults_present.clear()
+
+    def _vault_exists(self, vault_manager):
+        if vault_manager.usb_path in self._vaults_present:
+            return True
+        if os.path.exists(vault_manager.ursafe_dir):
+            self._vaults_present.add(vault_manager.usb_path)
+            return True
+        return False
+
+    @property
+    def _pin_dialog(self):
+        if self._pin_dlg is None:
+            self._pin_dlg = PinDialog(self)
+        return self._pin_dlg
+
+    @property
+    def _verify_pin_dialog(self):
+        if self._verify_pin_dlg is None:
+            self._verify_pin_dlg = SimplePinDialog(self, "Verify PIN", "Enter your current PIN to confirm deletion:")
+        return self._verify_pin_dlg
+
+    @property
+    def _secret_dialog(self):
+        if self._secret_dlg is None:
+            self._secret_dlg = SecretDialog(self)
+        return self._secret_dlg
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Catch up on anything the skipped monitor ticks missed
+        self.populate_usb_drives()
+
+    @contextmanager
+    def _pause_usb_monitor(self):
+        """Stops the drive poll while a modal dialog runs its own event loop; nests safely."""
+        self._monitor_pauses += 1
+        self.usb_monitor_timer.stop()
+        try:
+            yield
+        finally:
+            self._monitor_pauses -= 1
+            if not self._monitor_pauses:
+                # Restarts with the interval chosen in __init__
+                self.usb_monitor_timer.start()
+
+    def log(self, level, message):
+        """Sends a diagnostic line to the security log console, or stdout if none is attached."""
+        if self.log_console is not None:
+            self.log_console.log_message(level, message)
         else:
-            delete_btn.setText("🗑️")  # Fallback to emoji if SVG fails
-        delete_btn.clicked.connect(lambda checked, r=row: self.delete_secret_row(r))
-        return delete_btn
-
-    def apply_button_style(self, button, base_color):
-        button.setStyleSheet(f"""
-            QPushButton {{ background-color: {base_color}; color: white; font-weight: bold; font-size: 12px; padding: 10px 20px; border: 2px solid {base_color}; border-radius: 6px; min-height: 20px; }}
-            QPushButton:hover {{ background-color: {self.darken_color(base_color, 0.1)}; border: 2px solid {self.darken_color(base_color, 0.3)}; }}
-            QPushButton:pressed {{ background-color: {self.darken_color(base_color, 0.3)}; border: 2px solid {self.darken_color(base_color, 0.4)}; }}
-            QPushButton:disabled {{ background-color: #e0e0e0; color: #9e9e9e; border: 2px solid #cccccc; }}
-        """)
+            print(f"[{level}] {message}")
+
+    def log_many(self, entries):
+        """Logs the (level, message) status lines of one user action; the console paints them in one pass.
+
+        These are console-only status lines, so they are dropped when no console is attached.
+        """
+        if self.log_console is not None:
+            self.log_console.log_many(entries)
 
-    def darken_color(self, hex_color, factor=0.2):
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        darkened = tuple(int(c * (1 - factor)) for c in rgb)
-        return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
+    @staticmethod
+    def darken_color(hex_color, factor=0.2):
+        return _darken_color(hex_color, factor)
 
     def update_ui_state(self):
         has_usb = bool(self.usb_combo.currentText())
-        self.refresh_button.setEnabled(True)
-        self.init_button.setEnabled(has_usb and not self.is_unlocked)
-        self.unlock_button.setEnabled(has_usb and not self.is_unlocked)
-        self.pin_input.setEnabled(has_usb and not self.is_unlocked)
-        self.add_secret_button.setEnabled(self.is_unlocked)
-        self.lock_button.setEnabled(self.is_unlocked)
-        self.secrets_table.setEnabled(self.is_unlocked)
-        self.delete_data_button.setEnabled(has_usb)
+        idle = not self._vault_busy
+        can_open = has_usb and not self.is_unlocked and idle
+        state = (
+            not self._scan_in_flight,  # refresh_button
+            can_open,  # init_button
+            can_open,  # unlock_button
+            can_open,  # pin_input
+            self.is_unlocked and idle,  # add_secret_button
+            self.is_unlocked and idle,  # lock_button
+            self.is_unlocked and idle,  # secrets_table
+            has_usb and idle,  # delete_data_button
+            not idle,  # busy_bar (visibility)
+        )
+        # Most calls (e.g. every monitor tick) change nothing, so only touch widgets on a real change
+        if state != self._ui_state:
+            self._ui_state = state
+            widgets = (
+                self.refresh_button, self.init_button, self.unlock_button, self.pin_input,
+                self.add_secret_button, self.lock_button, self.secrets_table, self.delete_data_button,
+            )
+            for widget, enabled in zip(widgets, state):
+                widget.setEnabled(enabled)
+            self.busy_bar.setVisible(state[-1])
+        if not idle:
+            return
         if not has_usb:
             self.status_label.setText("🔌 No USB drive detected - Insert USB drive and click 🔄 Refresh Drives")
         elif not self.is_unlocked:
@@ -267,33 +805,21 @@ class MainAppTab(QWidget):
 
     def handle_add_secret(self):
         if not self.is_unlocked: return
-        dialog = SecretDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            data = dialog.get_data()
-            if data:
-                row_position = self.secrets_table.rowCount()
-                self.secrets_table.insertRow(row_position)
-                self.secrets_table.setItem(row_position, 0, QTableWidgetItem(data["label"]))
-                self.secrets_table.setItem(row_position, 1, QTableWidgetItem(data["username"]))
-                self.secrets_table.setItem(row_position, 2, QTableWidgetItem(data["password"]))
-                delete_btn = self.create_delete_button(row_position)
-                self.secrets_table.setCellWidget(row_position, 3, delete_btn)
+        dialog = self._secret_dialog
+        with self._pause_usb_monitor():
+            accepted = dialog.exec() == QDialog.DialogCode.Accepted
+        data = dialog.get_data() if accepted else None
+        dialog.reset()
+        if data:
+            self.secrets_model.append_rows([Secret(data["label"], data["username"], data["password"])])
 
     def delete_secret_row(self, row):
-        if row >= self.secrets_table.rowCount(): return
-        label_item = self.secrets_table.item(row, 0)
-        label = label_item.text() if label_item else f"Row {row + 1}"
-        reply = QMessageBox.question(self, "Delete Secret", f"Are you sure you want to delete the secret '{label}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+        if row >= self.secrets_model.rowCount(): return
+        label = self.secrets_model.secret_at(row).label or f"Row {row + 1}"
+        with self._pause_usb_monitor():
+            reply = QMessageBox.question(self, "Delete Secret", f"Are you sure you want to delete the secret '{label}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.secrets_table.removeRow(row)
-            self.refresh_delete_buttons()
-
-    def refresh_delete_buttons(self):
-        for row in range(self.secrets_table.rowCount()):
-            widget = self.secrets_table.cellWidget(row, 3)
-            if widget:
-                widget.clicked.disconnect()
-                widget.clicked.connect(lambda checked, r=row: self.delete_secret_row(r))
+            self.secrets_model.remove_row(row)
 
     def handle_unlock(self):
         selected_drive = self.usb_combo.currentText()
@@ -304,136 +830,186 @@ class MainAppTab(QWidget):
         if not pin:
             QMessageBox.critical(self, "Unlock Error", "Please enter your PIN.")
             return
-        verification = verify_stick(selected_drive)
-        if not verification.get("valid", False):
-            QMessageBox.critical(self, "Unlock Error", f"Selected drive is not a valid UR Safe Stick.\nReason: {verification.get('reason', 'Unknown')}")
+        try:
+            vault_manager = self._vault_manager(selected_drive)
+        except Exception as e:
+            QMessageBox.critical(self, "Unlock Error", f"Failed to unlock vault:\n{str(e)}")
             return
+        self._vault_busy = True
+        self._pending_unlock = (selected_drive, pin)
+        self.update_ui_state()
+        self.status_label.setText("🔑 Deriving vault key with Argon2id...")
+        self._unlock_requested.emit(vault_manager, pin)
+
+    def _on_vault_unlocked(self, vault_manager, vault_data):
+        self._vault_busy = False
+        selected_drive, pin = self._pending_unlock
+        self._pending_unlock = None
+        self._vaults_present.add(selected_drive)
+        # Populate in one batch with repaints suspended, then lay out once
+        self.secrets_table.setUpdatesEnabled(False)
         try:
-            vault_manager = VaultManager(selected_drive)
-            vault_data = vault_manager.unlock_vault(pin)
-            self.secrets_table.setRowCount(0)
-            for row, (secret_id, secret) in enumerate(vault_data.items()):
-                self.secrets_table.insertRow(row)
-                self.secrets_table.setItem(row, 0, QTableWidgetItem(secret.get("label", secret_id)))
-                self.secrets_table.setItem(row, 1, QTableWidgetItem(secret.get("username", "")))
-                self.secrets_table.setItem(row, 2, QTableWidgetItem(secret.get("password", "")))
-                delete_btn = self.create_delete_button(row)
-                self.secrets_table.setCellWidget(row, 3, delete_btn)
-            self.is_unlocked = True
-            self.current_vault_manager = vault_manager
-            self.current_pin = pin
-            self.current_usb_drive = selected_drive
-            from ursafe_sdk.chunk_manager import get_host_chunk_dir
-            host_chunk_dir = get_host_chunk_dir()
-            host_chunks_exist = os.path.exists(host_chunk_dir) and len(os.listdir(host_chunk_dir)) > 0
-            status_info = (
-                f"🔓 VAULT UNLOCKED - {len(vault_data)} secrets loaded\n"
-                f"🔐 Encryption: AES-256-GCM with Argon2id key derivation\n"
-                f"💾 USB Drive: {selected_drive} | 🖥️ Host Chunks: {'✅ Present' if host_chunks_exist else '❌ Missing'}\n"
-                f"🔑 Security: 4-Factor Authentication (USB + PIN + Host + Hardware Fingerprint)"
+            self.secrets_model.set_rows(
+                Secret(secret.get("label", secret_id), secret.get("username", ""), secret.get("password", ""))
+                for secret_id, secret in vault_data.items()
             )
-            self.status_label.setText(status_info)
+        finally:
+            self.secrets_table.setUpdatesEnabled(True)
+        self.is_unlocked = True
+        self.current_vault_manager = vault_manager
+        self.current_pin = pin
+        self.current_usb_drive = selected_drive
+        from ursafe_sdk.chunk_manager import get_host_chunk_dir
+        host_chunk_dir = get_host_chunk_dir()
+        host_chunks_exist = _dir_nonempty(host_chunk_dir)
+        status_info = (
+            f"🔓 VAULT UNLOCKED - {len(vault_data)} secrets loaded\n"
+            f"🔐 Encryption: AES-256-GCM with Argon2id key derivation\n"
+            f"💾 USB Drive: {selected_drive} | 🖥️ Host Chunks: {'✅ Present' if host_chunks_exist else '❌ Missing'}\n"
+            f"🔑 Security: 4-Factor Authentication (USB + PIN + Host + Hardware Fingerprint)"
+        )
+        self.status_label.setText(status_info)
+        self.log_many([
+            ("SUCCESS", f"Vault unlocked on {selected_drive}: {len(vault_data)} secrets loaded"),
+            ("INFO", f"Host chunks at {host_chunk_dir}: {'present' if host_chunks_exist else 'missing'}"),
+        ])
+        self.update_ui_state()
+        QMessageBox.information(self, "Success", f"Vault unlocked successfully!\nFound {len(vault_data)} secrets.")
+
+    def _on_vault_failed(self, operation, error):
+        self._vault_busy = False
+        if operation == "verify":
+            self._pending_unlock = None
             self.update_ui_state()
-            QMessageBox.information(self, "Success", f"Vault unlocked successfully!\nFound {len(vault_data)} secrets.")
-        except Exception as e:
-            QMessageBox.critical(self, "Unlock Error", f"Failed to unlock vault:\n{str(e)}")
+            QMessageBox.critical(self, "Unlock Error", f"Selected drive is not a valid UR Safe Stick.\nReason: {error}")
+        elif operation == "unlock":
+            self._pending_unlock = None
+            self.update_ui_state()
+            QMessageBox.critical(self, "Unlock Error", f"Failed to unlock vault:\n{error}")
             self.pin_input.clear()
+        elif operation == "initialize":
+            self.update_ui_state()
+            QMessageBox.critical(self, "Failure", f"An unexpected error occurred during initialization:\n{error}")
+        elif operation == "delete":
+            self.status_label.setText("⚠️ Vault data was not deleted")
+            self.update_ui_state()
+            QMessageBox.critical(self, "Delete Error", f"Failed to delete vault data:\n{error}")
+        else:
+            self.status_label.setText("⚠️ Vault could not be saved - it is still unlocked")
+            self.update_ui_state()
+            QMessageBox.critical(self, "Lock Error", f"Failed to save and lock vault:\n{error}")
 
     def handle_lock(self):
         if not hasattr(self, 'current_vault_manager') or not self.current_vault_manager:
             QMessageBox.warning(self, "Lock Error", "No vault is currently unlocked.")
             return
-        try:
-            new_vault_data = {}
-            for row in range(self.secrets_table.rowCount()):
-                label = self.secrets_table.item(row, 0).text() if self.secrets_table.item(row, 0) else ""
-                if label:
-                    new_vault_data[label] = {
-                        "label": label, 
-                        "username": self.secrets_table.item(row, 1).text() if self.secrets_table.item(row, 1) else "",
-                        "password": self.secrets_table.item(row, 2).text() if self.secrets_table.item(row, 2) else ""
-                    }
-            self.status_label.setText("💾 Saving vault data with AES-256-GCM encryption...")
-            self.current_vault_manager.save_vault(self.current_pin, new_vault_data)
-            self.secrets_table.setRowCount(0)
-            self.pin_input.clear()
-            self.is_unlocked = False
-            self.current_vault_manager = None
-            self.current_pin = None
-            self.current_usb_drive = None
-            self.status_label.setText("🔒 Vault locked and secured - Data encrypted and saved")
-            self.update_ui_state()
-            QMessageBox.information(self, "Locked", f"Vault has been saved and locked.\n{len(new_vault_data)} secrets saved.")
-        except Exception as e:
-            QMessageBox.critical(self, "Lock Error", f"Failed to save and lock vault:\n{str(e)}")
+        # One pass over the model's records; no Qt calls involved
+        new_vault_data = {secret.label: secret._asdict() for secret in self.secrets_model.secrets() if secret.label}
+        self._vault_busy = True
+        self.update_ui_state()
+        self.status_label.setText("💾 Saving vault data with AES-256-GCM encryption...")
+        self._save_requested.emit(self.current_vault_manager, self.current_pin, new_vault_data)
+
+    def _on_vault_saved(self, secret_count):
+        self._vault_busy = False
+        self.secrets_model.clear()
+        self.pin_input.clear()
+        self.is_unlocked = False
+        self.current_vault_manager = None
+        self.current_pin = None
+        self.current_usb_drive = None
+        self.status_label.setText("🔒 Vault locked and secured - Data encrypted and saved")
+        self.log_many([
+            ("SUCCESS", f"Vault saved with {secret_count} secrets"),
+            ("INFO", "Vault locked; secrets and PIN removed from the window"),
+        ])
+        self.update_ui_state()
+        QMessageBox.information(self, "Locked", f"Vault has been saved and locked.\n{secret_count} secrets saved.")
 
     def handle_delete_data(self):
         selected_drive = self.usb_combo.currentText()
         if not selected_drive:
             QMessageBox.warning(self, "Delete Error", "No USB drive selected.")
             return
-        vault_manager = VaultManager(selected_drive)
-        if not os.path.exists(vault_manager.ursafe_dir):
+        vault_manager = self._vault_manager(selected_drive)
+        if not self._vault_exists(vault_manager):
             QMessageBox.information(self, "Delete Error", "No vault data found on this USB drive.")
             return
-        reply = QMessageBox.question(self, "⚠️ PERMANENT DELETION WARNING ⚠️", f"This will PERMANENTLY DELETE all data from the vault on {selected_drive}!\n\nThis includes:\n• All saved passwords and secrets\n• All host chunks on this computer\n• All vault encryption keys\n\n⚠️ THIS CANNOT BE UNDONE! ⚠️\n\nAre you absolutely sure you want to continue?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+        with self._pause_usb_monitor():
+            reply = QMessageBox.question(self, "⚠️ PERMANENT DELETION WARNING ⚠️", f"This will PERMANENTLY DELETE all data from the vault on {selected_drive}!\n\nThis includes:\n• All saved passwords and secrets\n• All host chunks on this computer\n• All vault encryption keys\n\n⚠️ THIS CANNOT BE UNDONE! ⚠️\n\nAre you absolutely sure you want to continue?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         if reply != QMessageBox.StandardButton.Yes: return
-        dialog = SimplePinDialog(self, "Verify PIN", "Enter your current PIN to confirm deletion:")
-        if dialog.exec() != QDialog.DialogCode.Accepted: return
-        pin = dialog.get_pin()
+        dialog = self._verify_pin_dialog
+        with self._pause_usb_monitor():
+            accepted = dialog.exec() == QDialog.DialogCode.Accepted
+        pin = dialog.get_pin() if accepted else None
+        dialog.reset()
+        if not accepted: return
         if not pin:
             QMessageBox.critical(self, "PIN Error", "PIN is required for deletion.")
             return
-        try:
-            secret_count = len(vault_manager.unlock_vault(pin))
-            import shutil
-            if os.path.exists(vault_manager.ursafe_dir): shutil.rmtree(vault_manager.ursafe_dir)
-            from ursafe_sdk.chunk_manager import get_host_chunk_dir
-            host_chunk_dir = get_host_chunk_dir()
-            if os.path.exists(host_chunk_dir): shutil.rmtree(host_chunk_dir)
-            self.secrets_table.setRowCount(0)
-            self.pin_input.clear()
-            self.is_unlocked = False
-            self.current_vault_manager = None
-            self.current_pin = None
-            self.update_ui_state()
-            QMessageBox.information(self, "Data Deleted", f"Successfully deleted all vault data!\n\n• {secret_count} secrets deleted from USB\n• Host chunks deleted from computer\n• Vault completely removed\n\nThe USB drive can now be reinitialized.")
-        except Exception as e:
-            QMessageBox.critical(self, "Delete Error", f"Failed to delete vault data:\n{str(e)}")
+        self._vault_busy = True
+        self.update_ui_state()
+        self.status_label.setText("🗑️ Verifying PIN and deleting vault data...")
+        self._delete_requested.emit(vault_manager, pin)
+
+    def _on_vault_deleted(self, secret_count):
+        self._vault_busy = False
+        self._vaults_present.clear()
+        self.secrets_model.clear()
+        self.pin_input.clear()
+        self.is_unlocked = False
+        self.current_vault_manager = None
+        self.current_pin = None
+        self.log_many([
+            ("WARN", f"Vault deleted: {secret_count} secrets removed from USB"),
+            ("WARN", "Host chunks deleted from this computer"),
+        ])
+        self.update_ui_state()
+        QMessageBox.information(self, "Data Deleted", f"Successfully deleted all vault data!\n\n• {secret_count} secrets deleted from USB\n• Host chunks deleted from computer\n• Vault completely removed\n\nThe USB drive can now be reinitialized.")
 
     def handle_initialize(self):
         selected_drive = self.usb_combo.currentText()
         if not selected_drive:
             QMessageBox.warning(self, "Initialization Error", "No USB drive selected.")
             return
-        vault_manager = VaultManager(selected_drive)
-        if os.path.exists(vault_manager.ursafe_dir):
-            reply = QMessageBox.question(self, "Vault Already Exists", f"A vault already exists on {selected_drive}!\n\nTo initialize a new vault, you must first delete the existing data.\nUse the 'Delete All Data' button to remove the current vault.\n\nDo you want to delete the existing vault and create a new one?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+        vault_manager = self._vault_manager(selected_drive)
+        if self._vault_exists(vault_manager):
+            with self._pause_usb_monitor():
+                reply = QMessageBox.question(self, "Vault Already Exists", f"A vault already exists on {selected_drive}!\n\nTo initialize a new vault, you must first delete the existing data.\nUse the 'Delete All Data' button to remove the current vault.\n\nDo you want to delete the existing vault and create a new one?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.Yes:
                 self.handle_delete_data()
                 return
             else:
                 return
-        reply = QMessageBox.question(self, "Confirm Initialization", f"Are you sure you want to initialize the drive at {selected_drive}?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
+        with self._pause_usb_monitor():
+            reply = QMessageBox.question(self, "Confirm Initialization", f"Are you sure you want to initialize the drive at {selected_drive}?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
         if reply == QMessageBox.StandardButton.Cancel: return
-        dialog = PinDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            pin = dialog.get_pin()
+        dialog = self._pin_dialog
+        with self._pause_usb_monitor():
+            accepted = dialog.exec() == QDialog.DialogCode.Accepted
+        pin = dialog.get_pin() if accepted else None
+        # Don't leave the PIN sitting in the hidden dialog
+        dialog.reset()
+        if accepted:
             if not pin:
                 QMessageBox.critical(self, "PIN Error", "PINs did not match or were empty.")
                 return
-            try:
-                vault_manager = VaultManager(selected_drive)
-                vault_manager.initialize_vault(pin)
-                vault_manager.save_vault(pin, {})
-                QMessageBox.information(self, "Success", f"UR Safe Stick successfully initialized on {selected_drive}!")
-            except Exception as e:
-                QMessageBox.critical(self, "Failure", f"An unexpected error occurred during initialization:\n{str(e)}")
+            self._vault_busy = True
+            self.update_ui_state()
+            self.status_label.setText(f"🛠️ Initializing UR Safe Stick on {selected_drive}...")
+            self._initialize_requested.emit(vault_manager, pin)
+
+    def _on_vault_initialized(self, drive):
+        self._vault_busy = False
+        self._vaults_present.add(drive)
+        self.update_ui_state()
+        QMessageBox.information(self, "Success", f"UR Safe Stick successfully initialized on {drive}!")
 
     def emergency_lock(self):
         """Emergency lock when USB is disconnected - doesn't try to save"""
         try:
-            self.secrets_table.setRowCount(0)
+            self.forget_vault_managers()
+            self.secrets_model.clear()
             self.pin_input.clear()
             self.is_unlocked = False
             self.current_vault_manager = None
@@ -442,51 +1018,151 @@ class MainAppTab(QWidget):
             self.status_label.setText("🔒 Emergency lock - USB drive disconnected, data not saved")
             self.update_ui_state()
         except Exception as e:
-            print(f"Error during emergency lock: {e}")
+            self.log("ERROR", f"Error during emergency lock: {e}")
 
     def check_usb_status(self):
+        # Nothing to show while hidden or minimized; an unlocked vault keeps being
+        # watched so pulling the drive still triggers the emergency lock
+        if not self.is_unlocked and (not self.isVisible() or self.window().isMinimized()):
+            return
+        # A message box is up (the prompts pause the timer themselves; this covers the
+        # result/error boxes) - wait so a disconnect alert never lands on top of it. An
+        # unlocked vault is still checked: its secrets must not stay on screen behind the
+        # box, so the emergency lock runs now and only the alert waits
+        if not self.is_unlocked and QApplication.activeModalWidget() is not None:
+            return
+        # Disconnect detection happens in _on_drives_ready once the worker reports back
         try:
-            if self.is_unlocked and self.current_usb_drive:
-                drives = find_usb_drives()
-                drive_paths = [drive['mountpoint'] for drive in drives]
-                if self.current_usb_drive not in drive_paths:
-                    # USB disconnected - emergency lock without saving
-                    self.emergency_lock()
-                    
-                    reply = QMessageBox.critical(
-                        self, 
-                        "USB Drive Disconnected", 
-                        f"The USB drive {self.current_usb_drive} has been disconnected!\n\n"
-                        "For security reasons, the vault has been locked and the application will close.\n"
-                        "Any unsaved changes have been lost.",
-                        QMessageBox.StandardButton.Ok
-                    )
-                    
-                    # Close the entire application
-                    import sys
-                    from PyQt6.QtWidgets import QApplication
-                    QApplication.instance().quit()
-                    sys.exit(0)
-                    
-            current_selection = self.usb_combo.currentText()
             self.populate_usb_drives()
-            index = self.usb_combo.findText(current_selection)
-            if index >= 0:
-                self.usb_combo.setCurrentIndex(index)
         except Exception as e:
-            print(f"Error checking USB status: {e}")
+            self.log("ERROR", f"Error checking USB status: {e}")
+
+    def handle_drive_disconnect(self, drives):
+        """Emergency-locks and quits if the unlocked vault's drive is missing from a fresh scan."""
+        if not (self.is_unlocked and self.current_usb_drive):
+            return False
+        if self.current_usb_drive in drive_cache.mountpoints(drives):
+            return False
+        # USB disconnected - emergency lock without saving
+        self._disconnected_drive = self.current_usb_drive
+        self.emergency_lock()
+        # Stop polling so nothing re-enters while the alert is pending
+        self.usb_monitor_timer.stop()
+        self._alert_disconnect_and_quit()
+        return True
+
+    def _alert_disconnect_and_quit(self):
+        """Tells the user the vault was emergency-locked, then quits; waits for an open message box to close first."""
+        if QApplication.activeModalWidget() is not None:
+            QTimer.singleShot(DISCONNECT_ALERT_RETRY_MS, self._alert_disconnect_and_quit)
+            return
+
+        QMessageBox.critical(
+            self,
+            "USB Drive Disconnected",
+            f"The USB drive {self._disconnected_drive} has been disconnected!\n\n"
+            "For security reasons, the vault has been locked and the application will close.\n"
+            "Any unsaved changes have been lost.",
+            QMessageBox.StandardButton.Ok
+        )
+
+        # Close the entire application; the event loop exits normally, so aboutToQuit
+        # still joins the worker threads
+        QApplication.instance().quit()
+
+    def drive_cache_fresh(self):
+        """
+        True while the shared drive scan is younger than DRIVE_CACHE_TTL. The monitor timer and
+        startup reuse a fresh scan; refresh clicks and hotplug events invalidate it first.
+        """
+        return drive_cache.peek(DRIVE_CACHE_TTL) is not None
+
+    def invalidate_drive_cache(self):
+        drive_cache.invalidate()
+
+    def handle_refresh(self):
+        # The first request opens a short window and later ones in it ride along, so a burst
+        # costs one scan and continuous clicking can't postpone the scan indefinitely
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _on_drives_changed(self):
+        self.handle_refresh()
+        self._settle_timer.start()
+
+    def _do_refresh(self):
+        # User-initiated refreshes and hotplug events always bypass the cache
+        self.invalidate_drive_cache()
+        self.populate_usb_drives()
 
     def populate_usb_drives(self):
+        """
+        Fills the drive combo from the cached scan if it is still fresh; otherwise
+        asks the worker thread for a new scan and fills the combo when it reports back.
+        """
+        cached = drive_cache.peek(DRIVE_CACHE_TTL)
+        if cached is not None:
+            # The scan may have come from another window, so it still gets the disconnect check
+            if not self.handle_drive_disconnect(cached):
+                self._apply_drives(cached)
+            return
+        if self._scan_in_flight:
+            return
+        self._scan_in_flight = True
+        self.update_ui_state()
+        QMetaObject.invokeMethod(self._scan_worker, "scan", Qt.ConnectionType.QueuedConnection)
+
+    def _on_drives_ready(self, drives):
+        self._scan_in_flight = False
+        if self.handle_drive_disconnect(drives):
+            return
+        if not self._apply_drives(drives):
+            # Drive set unchanged, but the refresh button still has to come back
+            self.update_ui_state()
+
+    def _on_scan_failed(self, error):
+        self._scan_in_flight = False
+        self.log("ERROR", f"Error finding USB drives: {error}")
+        self.update_ui_state()
+
+    def _apply_drives(self, drives):
+        """Syncs the drive combo with a scan; returns False (touching nothing) if the drive set is unchanged."""
+        new_set = drive_cache.mountpoints(drives)
+        if new_set == self._last_drive_set:
+            # Same drive set: leave the combo (and the user's selection) untouched
+            return False
         try:
-            self.usb_combo.clear()
-            drives = find_usb_drives()
-            if drives:
-                for drive in drives: 
-                    self.usb_combo.addItem(drive['mountpoint'])
+            self.usb_combo.blockSignals(True)
+            try:
+                # Patch the combo in place so the surviving entries (and the selection) stay put
+                for i in reversed(range(self.usb_combo.count())):
+                    if self.usb_combo.itemText(i) not in new_set:
+                        self.usb_combo.removeItem(i)
+                # Iterate the scan itself so new drives keep their enumeration order
+                for drive in drives:
+                    mountpoint = drive['mountpoint']
+                    if mountpoint not in self._last_drive_set:
+                        self.usb_combo.addItem(mountpoint)
+            finally:
+                self.usb_combo.blockSignals(False)
+            # The combo's signals were blocked, so drop what was learnt about vanished drives
+            # here; a stick later mounted at the same path starts with a fresh VaultManager
+            # and is checked for a vault again
+            for mountpoint in self._vault_managers.keys() - new_set:
+                del self._vault_managers[mountpoint]
+            self._vaults_present.intersection_update(new_set)
+            self._last_drive_set = new_set
         except Exception as e:
-            print(f"Error finding USB drives: {e}")
+            self.log("ERROR", f"Error finding USB drives: {e}")
         finally:
             self.update_ui_state()
+        return True
+
+    def shutdown_workers(self):
+        self.usb_watcher.stop()
+        for thread in (self._scan_thread, self._vault_thread):
+            thread.quit()
+            thread.wait()
 
 # --- CHANGE 4: The __main__ block is removed. ---
 # This file is no longer intended to be run directly.
\ No newline at end of file
@@ -1,12 +1,12 @@
 # file: dashboard/mockup_widget.py
 # This file contains Team 3's UI, refactored into a reusable QWidget.
 
+import os
 import sys
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QTabWidget, 
-                             QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QFormLayout,
-                             QPlainTextEdit)
-from PyQt6.QtGui import QPixmap, QColor
-from PyQt6.QtCore import Qt
+                             QLabel, QTableView, QHeaderView, QFormLayout)
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache, QColor
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
 
 # --- MOCK DATA (Copied from Team 3's file) ---
 MOCK_CHUNK_STATUS = {
@@ -22,6 +22,132 @@ MOCK_SYSTEM_INFO = {"pc_id": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1
 MOCK_LOG_CHAIN = [{"timestamp": "2025-10-05T10:30:00Z", "action": "Vault Initialized", "prev_hash": "000000", "verified": True}, {"timestamp": "2025-10-05T10:32:15Z", "action": "Vault Unlocked", "prev_hash": "a1b2c3", "verified": True}, {"timestamp": "2025-10-05T10:35:45Z", "action": "Secret 'Gmail' Added", "prev_hash": "d4e5f6", "verified": True}, {"timestamp": "2025-10-05T10:36:00Z", "action": "Vault Locked", "prev_hash": "g7h8i9", "verified": True}]
 MOCK_USB_INFO = {"drive_path": "F:\\", "serial": "AA12345678", "total_space": "32.0 GB", "free_space": "31.0 GB", "file_system": "FAT32", "vault_present": True}
 
+# (label, value) rows for the form tabs, rendered once from the frozen MOCK data at import
+_CHUNK_ROWS = (
+    ("<b>Reconstruction Status:</b>", "✅ Possible" if MOCK_CHUNK_STATUS['reconstruction_possible'] else "❌ Not Possible"),
+    ("<b>Shares (Required / Total):</b>", f"{MOCK_CHUNK_STATUS['required_shares']} of {MOCK_CHUNK_STATUS['total_shares']}"),
+    ("<b>Host Chunks Available:</b>", f"{MOCK_CHUNK_STATUS['host_available']} at <code>{MOCK_CHUNK_STATUS['host_location']}</code>"),
+)
+_HOST_FILES_TEXT = "\n".join(MOCK_CHUNK_STATUS['host_files'])
+_CHUNK_USB_ROWS = (
+    ("<b>USB Chunks Available:</b>", f"{MOCK_CHUNK_STATUS['usb_available']} at <code>{MOCK_CHUNK_STATUS['usb_location']}</code>"),
+)
+_PC_ID_HTML = f"<code>{MOCK_SYSTEM_INFO['pc_id']}</code>"
+_SYSTEM_ROWS = (
+    ("<b>Platform:</b>", MOCK_SYSTEM_INFO['platform']),
+    ("<b>CPU ID:</b>", f"<code>{MOCK_SYSTEM_INFO['cpu_id']}</code>"),
+    ("<b>Motherboard Serial:</b>", f"<code>{MOCK_SYSTEM_INFO['mb_serial']}</code>"),
+    ("<b>MAC Addresses:</b>", "<code>{}</code>".format("\n".join(MOCK_SYSTEM_INFO['mac_addresses']))),
+)
+_USB_ROWS = (
+    ("<b>Vault Status:</b>", "✅ Detected" if MOCK_USB_INFO['vault_present'] else "❌ Not Found"),
+    ("<b>Drive Path:</b>", f"<code>{MOCK_USB_INFO['drive_path']}</code>"),
+    ("<b>Volume Serial:</b>", f"<code>{MOCK_USB_INFO['serial']}</code>"),
+    ("<b>File System:</b>", MOCK_USB_INFO['file_system']),
+    ("<b>Capacity:</b>", f"{MOCK_USB_INFO['total_space']} (Free: {MOCK_USB_INFO['free_space']})"),
+)
+_CRYPTO_ROWS = (
+    ("<b>Key Derivation (KDF):</b>", "Argon2id (time=2, mem=64MiB, parallelism=2)"),
+    ("<b>Symmetric Encryption:</b>", "AES-256-GCM (12-byte nonce, 16-byte tag)"),
+    ("<b>Digital Signatures:</b>", "Ed25519"),
+    ("<b>Secret Splitting:</b>", "Shamir's Secret Sharing (10-of-20)"),
+    ("<b>Hashing:</b>", "SHA-256"),
+)
+
+def _add_rows(layout, rows):
+    for label, value in rows:
+        layout.addRow(QLabel(label), QLabel(value))
+
+WORKFLOW_IMAGE = "assets/workflow.png"
+WORKFLOW_SIZE = (800, 500)
+# Pre-scaled copy of the workflow image, so later sessions skip the smooth scale
+PIXMAP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ursafe")
+
+_WORKFLOW_KEY = f"{WORKFLOW_IMAGE}@{WORKFLOW_SIZE[0]}x{WORKFLOW_SIZE[1]}"
+
+def _workflow_image():
+    """
+    Returns the workflow image scaled to WORKFLOW_SIZE, or a null image if the source is
+    missing. Uses the on-disk copy when it is newer than the source; otherwise scales the
+    original and writes the copy. QImage (unlike QPixmap) is safe off the GUI thread.
+    """
+    width, height = WORKFLOW_SIZE
+    try:
+        source_mtime = os.path.getmtime(WORKFLOW_IMAGE)
+    except OSError:
+        return QImage()
+    cache_path = os.path.join(PIXMAP_CACHE_DIR, f"workflow_{width}x{height}.png")
+    try:
+        image = QImage(cache_path) if os.path.getmtime(cache_path) >= source_mtime else None
+    except OSError:
+        image = None
+    if image is None or image.isNull():
+        image = QImage(WORKFLOW_IMAGE)
+        if image.isNull():
+            return image
+        image = image.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        # Best-effort cache: if it can't be written the image is simply scaled again next run
+        try:
+            os.makedirs(PIXMAP_CACHE_DIR, exist_ok=True)
+            image.save(cache_path, "PNG")
+        except OSError:
+            pass
+    return image
+
+class _ImageLoaderSignals(QObject):
+    loaded = pyqtSignal(QImage)
+
+class _WorkflowImageLoader(QRunnable):
+    """Decodes (and if needed scales) the workflow image on a pool thread."""
+    def __init__(self):
+        super().__init__()
+        self.signals = _ImageLoaderSignals()
+
+    def run(self):
+        self.signals.loaded.emit(_workflow_image())
+
+
+# Looked up once; data() runs for every painted cell and role
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_CENTER = Qt.AlignmentFlag.AlignCenter
+
+class MockLogChainModel(QAbstractTableModel):
+    """Read-only model over MOCK_LOG_CHAIN; the Verified column shows a centered green check."""
+    HEADERS = ("Timestamp", "Action", "Previous Hash", "Verified")
+    _KEYS = ("timestamp", "action", "prev_hash")
+    _VERIFIED_COLOR = QColor("#2ecc71")
+
+    def __init__(self, rows, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        column = index.column()
+        if role == _DISPLAY_ROLE:
+            if column == 3:
+                return "✔"
+            value = self._rows[index.row()][self._KEYS[column]]
+            return f"<code>{value}</code>" if column == 2 else value
+        if column == 3:
+            if role == _FOREGROUND_ROLE:
+                return self._VERIFIED_COLOR
+            if role == _ALIGNMENT_ROLE:
+                return _CENTER
+        return None
+
 
 # --- CHANGE 1: Class name and inheritance changed ---
 class MockupTabWidget(QWidget):
@@ -34,82 +160,74 @@ class MockupTabWidget(QWidget):
         main_layout.addWidget(self.tabs)
         # -------------------------------------------------
 
-        # The rest of the code is identical to Team 3's file
-        self.tabs.addTab(self.create_chunk_status_tab(), "Chunk Status")
-        self.tabs.addTab(self.create_system_info_tab(), "System Fingerprint")
-        self.tabs.addTab(self.create_usb_info_tab(), "USB Drive Info")
-        self.tabs.addTab(self.create_log_chain_tab(), "Log Chain (Blockchain)")
-        self.tabs.addTab(self.create_crypto_primitives_tab(), "Crypto Primitives")
-        self.tabs.addTab(self.create_workflow_viz_tab(), "Workflow Visualization")
+        # Tabs start as empty hosts and are built the first time they are shown, so
+        # opening the dashboard doesn't pay for tabs (like the workflow image) nobody views
+        self._builders = []
+        for builder, title in (
+            (self.create_chunk_status_tab, "Chunk Status"),
+            (self.create_system_info_tab, "System Fingerprint"),
+            (self.create_usb_info_tab, "USB Drive Info"),
+            (self.create_log_chain_tab, "Log Chain (Blockchain)"),
+            (self.create_crypto_primitives_tab, "Crypto Primitives"),
+            (self.create_workflow_viz_tab, "Workflow Visualization"),
+        ):
+            host = QWidget()
+            QVBoxLayout(host).setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(host, title)
+            self._builders.append(builder)
+        self._built = set()
+        self.tabs.currentChanged.connect(self._materialize)
+        self._materialize(self.tabs.currentIndex())
+
+    def _materialize(self, index):
+        """Builds tab `index` into its host widget on first view."""
+        if index < 0 or index in self._built:
+            return
+        self._built.add(index)
+        self.tabs.widget(index).layout().addWidget(self._builders[index]())
 
     # All of Team 3's 'create_*_tab' methods are copied here verbatim
     def create_chunk_status_tab(self):
         widget = QWidget()
         layout = QFormLayout(widget)
-        status = "✅ Possible" if MOCK_CHUNK_STATUS['reconstruction_possible'] else "❌ Not Possible"
-        layout.addRow(QLabel("<b>Reconstruction Status:</b>"), QLabel(status))
-        layout.addRow(QLabel("<b>Shares (Required / Total):</b>"), QLabel(f"{MOCK_CHUNK_STATUS['required_shares']} of {MOCK_CHUNK_STATUS['total_shares']}"))
-        layout.addRow(QLabel("<b>Host Chunks Available:</b>"), QLabel(f"{MOCK_CHUNK_STATUS['host_available']} at <code>{MOCK_CHUNK_STATUS['host_location']}</code>"))
-        host_files_text = QPlainTextEdit()
-        host_files_text.setReadOnly(True)
-        host_files_text.setPlainText("\n".join(MOCK_CHUNK_STATUS['host_files']))
+        _add_rows(layout, _CHUNK_ROWS)
+        host_files_text = QLabel(_HOST_FILES_TEXT)
+        host_files_text.setTextFormat(Qt.TextFormat.PlainText)
+        host_files_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         host_files_text.setMaximumHeight(150)
         layout.addRow(QLabel("<b>Host Chunk Files:</b>"), host_files_text)
-        layout.addRow(QLabel("<b>USB Chunks Available:</b>"), QLabel(f"{MOCK_CHUNK_STATUS['usb_available']} at <code>{MOCK_CHUNK_STATUS['usb_location']}</code>"))
+        _add_rows(layout, _CHUNK_USB_ROWS)
         return widget
 
     def create_system_info_tab(self):
         widget = QWidget()
         layout = QFormLayout(widget)
-        pc_id_label = QLabel(f"<code>{MOCK_SYSTEM_INFO['pc_id']}</code>")
+        pc_id_label = QLabel(_PC_ID_HTML)
         pc_id_label.setWordWrap(True)
         layout.addRow(QLabel("<b>Bound PC Fingerprint (Hash):</b>"), pc_id_label)
-        layout.addRow(QLabel("<b>Platform:</b>"), QLabel(MOCK_SYSTEM_INFO['platform']))
-        layout.addRow(QLabel("<b>CPU ID:</b>"), QLabel(f"<code>{MOCK_SYSTEM_INFO['cpu_id']}</code>"))
-        layout.addRow(QLabel("<b>Motherboard Serial:</b>"), QLabel(f"<code>{MOCK_SYSTEM_INFO['mb_serial']}</code>"))
-        mac_text = "\n".join(MOCK_SYSTEM_INFO['mac_addresses'])
-        layout.addRow(QLabel("<b>MAC Addresses:</b>"), QLabel(f"<code>{mac_text}</code>"))
+        _add_rows(layout, _SYSTEM_ROWS)
         return widget
 
     def create_usb_info_tab(self):
         widget = QWidget()
         layout = QFormLayout(widget)
-        vault_status = "✅ Detected" if MOCK_USB_INFO['vault_present'] else "❌ Not Found"
-        layout.addRow(QLabel("<b>Vault Status:</b>"), QLabel(vault_status))
-        layout.addRow(QLabel("<b>Drive Path:</b>"), QLabel(f"<code>{MOCK_USB_INFO['drive_path']}</code>"))
-        layout.addRow(QLabel("<b>Volume Serial:</b>"), QLabel(f"<code>{MOCK_USB_INFO['serial']}</code>"))
-        layout.addRow(QLabel("<b>File System:</b>"), QLabel(MOCK_USB_INFO['file_system']))
-        layout.addRow(QLabel("<b>Capacity:</b>"), QLabel(f"{MOCK_USB_INFO['total_space']} (Free: {MOCK_USB_INFO['free_space']})"))
+        _add_rows(layout, _USB_ROWS)
         return widget
 
     def create_log_chain_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        table = QTableWidget()
-        table.setColumnCount(4)
-        table.setHorizontalHeaderLabels(["Timestamp", "Action", "Previous Hash", "Verified"])
-        table.setRowCount(len(MOCK_LOG_CHAIN))
-        for row, entry in enumerate(MOCK_LOG_CHAIN):
-            table.setItem(row, 0, QTableWidgetItem(entry['timestamp']))
-            table.setItem(row, 1, QTableWidgetItem(entry['action']))
-            table.setItem(row, 2, QTableWidgetItem(f"<code>{entry['prev_hash']}</code>"))
-            verified_item = QTableWidgetItem("✔")
-            verified_item.setForeground(QColor("#2ecc71"))
-            verified_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            table.setItem(row, 3, verified_item)
+        table = QTableView()
+        # The model has no setData, so the table is read-only without edit triggers
+        table.setModel(MockLogChainModel(MOCK_LOG_CHAIN, table))
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         layout.addWidget(table)
         return widget
         
     def create_crypto_primitives_tab(self):
         widget = QWidget()
         layout = QFormLayout(widget)
-        layout.addRow(QLabel("<b>Key Derivation (KDF):</b>"), QLabel("Argon2id (time=2, mem=64MiB, parallelism=2)"))
-        layout.addRow(QLabel("<b>Symmetric Encryption:</b>"), QLabel("AES-256-GCM (12-byte nonce, 16-byte tag)"))
-        layout.addRow(QLabel("<b>Digital Signatures:</b>"), QLabel("Ed25519"))
-        layout.addRow(QLabel("<b>Secret Splitting:</b>"), QLabel("Shamir's Secret Sharing (10-of-20)"))
-        layout.addRow(QLabel("<b>Hashing:</b>"), QLabel("SHA-256"))
+        _add_rows(layout, _CRYPTO_ROWS)
         return widget
 
     def create_workflow_viz_tab(self):
@@ -117,12 +235,28 @@ class MockupTabWidget(QWidget):
         layout = QVBoxLayout(widget)
         label = QLabel("<b>Unlock Workflow Visualization</b>")
         image_label = QLabel()
-        pixmap = QPixmap("assets/workflow.png") 
-        if pixmap.isNull():
-            image_label.setText("Image not found: Please create assets/workflow.png")
-        else:
-            image_label.setPixmap(pixmap.scaled(800, 500, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        pixmap = QPixmapCache.find(_WORKFLOW_KEY)
+        if pixmap is not None:
+            image_label.setPixmap(pixmap)
+        else:
+            # Decode off the GUI thread; only the QImage -> QPixmap conversion happens here
+            image_label.setText("Loading workflow image...")
+            self._workflow_label = image_label
+            loader = _WorkflowImageLoader()
+            # Bound to this widget, so the connection goes away with it if it closes first
+            loader.signals.loaded.connect(self._show_workflow_image)
+            self._image_loader_signals = loader.signals
+            QThreadPool.globalInstance().start(loader)
         layout.addWidget(label)
         layout.addWidget(image_label)
-        return widget
\ No newline at end of file
+        return widget
+
+    def _show_workflow_image(self, image):
+        image_label = self._workflow_label
+        if image.isNull():
+            image_label.setText(f"Image not found: Please create {WORKFLOW_IMAGE}")
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(_WORKFLOW_KEY, pixmap)
+        image_label.setPixmap(pixmap)
\ No newline at end of file
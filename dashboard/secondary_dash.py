@@ -3,14 +3,125 @@
 import sys
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget, QLabel,
-    QTableWidget, QHeaderView, QTableWidgetItem, QTextEdit, QGridLayout
+    QTableView, QHeaderView, QGridLayout
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QEvent, QAbstractTableModel, QModelIndex, QObject, QThread,
+    QCoreApplication, QMetaObject, pyqtSignal, pyqtSlot
 )
-from PyQt6.QtCore import QTimer
 
 from dashboard.utils.data_collector import DataCollector
+from ursafe_sdk.log_manager import iso_from_ns
 # --- NEW: Import Team 3's refactored UI widget ---
 from dashboard.mockup_widget import MockupTabWidget
 
+# Poll interval while the data is changing, and after IDLE_AFTER_POLLS unchanged polls in a row
+REFRESH_MS = 3000
+IDLE_REFRESH_MS = 10000
+IDLE_AFTER_POLLS = 2
+
+# "key: value" per line for the hardware/USB panes
+_format_pair = "{0[0]}: {0[1]}".format
+_CHUNK_TEMPLATE = (
+    "M-of-N: {}-of-{}\n"
+    "Reconstruction Possible: {}\n\n"
+    "Host Chunks ({} found):\n{}\n\n"
+    "USB Chunks ({} found):\n{}"
+)
+_CHUNK_FIELDS = (
+    "required_shares", "total_shares", "reconstruction_possible",
+    "host_available", "host_location", "usb_available", "usb_location",
+)
+
+def _summary_label():
+    """Read-only, selectable plain-text panel (no QTextDocument behind it)."""
+    label = QLabel()
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+    label.setWordWrap(True)
+    label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+    return label
+
+# Looked up once; data() runs for every painted cell and role
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+class LogChainModel(QAbstractTableModel):
+    """
+    Read-only model for the log chain table. Refreshes hand over the whole entry
+    list (see set_rows); the view only formats the cells it paints.
+    """
+    HEADERS = ("Timestamp", "Action", "Prev. Hash", "Verified")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role != _DISPLAY_ROLE:
+            return None
+        entry = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            timestamp = entry.get("timestamp", "")
+            # Newer entries store integer nanoseconds, older ones an ISO string
+            return iso_from_ns(timestamp) if isinstance(timestamp, int) else timestamp
+        if column == 1:
+            return entry.get("action", "")
+        if column == 2:
+            return str(entry.get("prev_hash", ""))
+        return str(entry.get("verified", "N/A"))
+
+    def set_rows(self, rows):
+        """
+        Replaces the log entries (a list of dicts from the data collector), notifying
+        the view as narrowly as possible: nothing when the chain is unchanged (the usual
+        poll), an insert when entries were appended, and a full reset otherwise.
+        """
+        old = self._rows
+        if rows == old:
+            return
+        count = len(old)
+        if len(rows) > count and rows[:count] == old:
+            self.beginInsertRows(QModelIndex(), count, len(rows) - 1)
+            self._rows = rows
+            self.endInsertRows()
+        elif len(rows) == count:
+            self._rows = rows
+            self.dataChanged.emit(self.index(0, 0), self.index(count - 1, len(self.HEADERS) - 1))
+        else:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+
+class DataFetchWorker(QObject):
+    """Runs the collector's SDK, disk and hardware queries on a background thread."""
+    data_ready = pyqtSignal(dict)
+    fetch_failed = pyqtSignal(str)
+
+    def __init__(self, collector):
+        super().__init__()
+        self.collector = collector
+
+    @pyqtSlot()
+    def fetch(self):
+        try:
+            data = self.collector.fetch_all_data()
+        except Exception as e:
+            self.fetch_failed.emit(str(e))
+            return
+        self.data_ready.emit(data)
+
 class SecondaryDashboard(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -25,9 +136,24 @@ class SecondaryDashboard(QMainWindow):
         # --- THIS LINE IS NOW UPDATED ---
         self._create_dummy_dashboard_tab()
 
+        # The collector lives on its own thread; the timer only asks for a fetch and the
+        # widgets are filled in when the result comes back
+        self._fetch_in_flight = False
+        self._fetch_thread = QThread(self)
+        self._fetch_worker = DataFetchWorker(self.collector)
+        self._fetch_worker.moveToThread(self._fetch_thread)
+        self._fetch_worker.data_ready.connect(self._apply_data)
+        self._fetch_worker.fetch_failed.connect(self._on_fetch_failed)
+        self._fetch_thread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self.shutdown_worker)
+
+        # Polls only while the window can be seen (see showEvent/hideEvent/changeEvent)
+        # and backs off to IDLE_REFRESH_MS while nothing changes
+        self._last_data = None
+        self._unchanged_polls = 0
         self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_MS)
         self.timer.timeout.connect(self.update_data_displays)
-        self.timer.start(3000)
         self.update_data_displays()
 
     def _create_live_data_tab(self):
@@ -36,22 +162,19 @@ class SecondaryDashboard(QMainWindow):
         layout = QGridLayout(tab_widget)
         layout.addWidget(QLabel("<b>System Information</b>"), 0, 0)
         self.pc_id_label = QLabel("PC ID: N/A")
-        self.hardware_info_text = QTextEdit()
-        self.hardware_info_text.setReadOnly(True)
+        self.hardware_info_text = _summary_label()
         layout.addWidget(self.pc_id_label, 1, 0)
         layout.addWidget(self.hardware_info_text, 2, 0)
         layout.addWidget(QLabel("<b>USB Information</b>"), 0, 1)
-        self.usb_info_text = QTextEdit()
-        self.usb_info_text.setReadOnly(True)
+        self.usb_info_text = _summary_label()
         layout.addWidget(self.usb_info_text, 1, 1, 2, 1)
         layout.addWidget(QLabel("<b>Chunk Status (Shamir's Secret Sharing)</b>"), 3, 0)
-        self.chunk_status_text = QTextEdit()
-        self.chunk_status_text.setReadOnly(True)
+        self.chunk_status_text = _summary_label()
         layout.addWidget(self.chunk_status_text, 4, 0, 1, 2)
         layout.addWidget(QLabel("<b>Blockchain Log Chain</b>"), 5, 0)
-        self.log_table = QTableWidget()
-        self.log_table.setColumnCount(4)
-        self.log_table.setHorizontalHeaderLabels(["Timestamp", "Action", "Prev. Hash", "Verified"])
+        self.log_table = QTableView()
+        self._log_model = LogChainModel(self.log_table)
+        self.log_table.setModel(self._log_model)
         self.log_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         layout.addWidget(self.log_table, 6, 0, 1, 2)
         self.tabs.addTab(tab_widget, "📈 Live Technical View")
@@ -63,26 +186,65 @@ class SecondaryDashboard(QMainWindow):
         mockup_widget = MockupTabWidget()
         self.tabs.addTab(mockup_widget, "UI Visualization")
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._resume_polling()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+            elif self.isVisible():
+                self._resume_polling()
+
+    def _resume_polling(self):
+        if self.timer.isActive():
+            return
+        # Catch up straight away, then poll at the fast rate until things settle again
+        self._unchanged_polls = 0
+        self.timer.start(REFRESH_MS)
+        self.update_data_displays()
+
     def update_data_displays(self):
-        # ... (This method is unchanged)
-        data = self.collector.fetch_all_data()
+        # A slow fetch just makes the next ticks skip instead of queuing up behind it
+        if self._fetch_in_flight:
+            return
+        self._fetch_in_flight = True
+        QMetaObject.invokeMethod(self._fetch_worker, "fetch", Qt.ConnectionType.QueuedConnection)
+
+    def _on_fetch_failed(self, error):
+        self._fetch_in_flight = False
+        print(f"Error fetching dashboard data: {error}")
+
+    def _apply_data(self, data):
+        self._fetch_in_flight = False
+        if data == self._last_data:
+            self._unchanged_polls += 1
+            if self._unchanged_polls == IDLE_AFTER_POLLS and self.timer.isActive():
+                self.timer.setInterval(IDLE_REFRESH_MS)
+            # The widgets already show exactly this
+            return
+        self._last_data = data
+        if self._unchanged_polls >= IDLE_AFTER_POLLS and self.timer.isActive():
+            self.timer.setInterval(REFRESH_MS)
+        self._unchanged_polls = 0
         sys_info = data.get("system_info", {})
         self.pc_id_label.setText(f"<b>PC ID:</b> {sys_info.get('pc_id', 'N/A')}")
-        hardware_str = "\n".join([f"{k}: {v}" for k, v in sys_info.get('hardware', {}).items()])
+        hardware_str = "\n".join(map(_format_pair, sys_info.get('hardware', {}).items()))
         self.hardware_info_text.setText(hardware_str if hardware_str else "Error: SDK function not found.")
-        usb_info = data.get("usb_info", {})
-        usb_str = "\n".join([f"{k}: {v}" for k, v in usb_info.items()])
+        usb_str = "\n".join(map(_format_pair, data.get("usb_info", {}).items()))
         self.usb_info_text.setText(usb_str if usb_str else "No USB connected or error.")
         chunk_info = data.get("chunk_status", {})
-        chunk_str = (f"M-of-N: {chunk_info.get('required_shares')}-of-{chunk_info.get('total_shares')}\n"
-                     f"Reconstruction Possible: {chunk_info.get('reconstruction_possible')}\n\n"
-                     f"Host Chunks ({chunk_info.get('host_available')} found):\n{chunk_info.get('host_location')}\n\n"
-                     f"USB Chunks ({chunk_info.get('usb_available')} found):\n{chunk_info.get('usb_location')}")
+        chunk_str = _CHUNK_TEMPLATE.format(*map(chunk_info.get, _CHUNK_FIELDS))
+        # QLabel.setText is a no-op for identical text, so an unchanged poll costs no relayout
         self.chunk_status_text.setText(chunk_str)
-        logs = data.get("log_chain", [])
-        self.log_table.setRowCount(len(logs))
-        for row, entry in enumerate(logs):
-            self.log_table.setItem(row, 0, QTableWidgetItem(entry.get("timestamp", "")))
-            self.log_table.setItem(row, 1, QTableWidgetItem(entry.get("action", "")))
-            self.log_table.setItem(row, 2, QTableWidgetItem(str(entry.get("prev_hash", ""))))
-            self.log_table.setItem(row, 3, QTableWidgetItem(str(entry.get("verified", "N/A"))))
\ No newline at end of file
+        self._log_model.set_rows(data.get("log_chain", []))
+
+    def shutdown_worker(self):
+        self._fetch_thread.quit()
+        self._fetch_thread.wait()
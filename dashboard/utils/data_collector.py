@@ -2,8 +2,9 @@
 
 import os
 import sys
-import glob
 import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 # --- THIS IS THE FIX ---
 # This block tells Python to look for modules in the project's root directory
@@ -19,6 +20,18 @@ from ursafe_sdk import (
     chunk_manager,
     log_manager
 )
+from dashboard.utils import drive_cache
+
+# Chunk files are named .c_<index>; a plain prefix test, no glob pattern needed
+_CHUNK_PREFIX = ".c_"
+
+def _chunk_names(directory: str) -> list:
+    """Names of the chunk files in directory; empty if it doesn't exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.name.startswith(_CHUNK_PREFIX)]
+    except FileNotFoundError:
+        return []
 
 class DataCollector:
     """
@@ -26,31 +39,59 @@ class DataCollector:
     UR Safe Stick SDK for the secondary technical dashboard.
     """
     def __init__(self):
-        pass
+        # Platform details can't change while the process runs; the fingerprint is cached
+        # by system_utils itself, and only once the hardware query has succeeded
+        self._hardware_cache = None
+        # (drive_path, device) -> get_drive_info() result for the drive last shown; the
+        # serial lookup may spawn blkid, so only disk usage is re-read on each poll
+        self._drive_info_cache = {}
+        # (log path, mtime_ns, size) -> verified entries; re-read only when the file changes
+        self._log_cache = {}
+        # The four queries hit independent resources (hardware, USB, host disk, USB log),
+        # so fetch_all_data overlaps their waits instead of running them back to back
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="urdc")
 
     def get_system_info(self) -> dict:
         """Fetches the hardware fingerprint and its components."""
         try:
             fingerprint_hash = system_utils.get_system_fingerprint().hex()
-            hardware_details = system_utils.get_hardware_info()
+            if self._hardware_cache is None:
+                self._hardware_cache = system_utils.get_hardware_info()
             return {
                 "pc_id": fingerprint_hash,
-                "hardware": hardware_details,
+                "hardware": self._hardware_cache,
                 "fingerprint_hash": fingerprint_hash
             }
         except Exception as e:
+            # Nothing cached, so the next poll tries again
             print(f"Error getting system info: {e}")
             return {}
 
-    def get_usb_info(self, drive_path: str) -> dict:
+    def _drive_details(self, drive_path: str, device) -> dict:
+        """get_drive_info() for the drive, reused until a different drive/device is shown."""
+        key = (drive_path, device)
+        drive = self._drive_info_cache.get(key)
+        if drive is None:
+            # Assuming usb_manager.get_drive_info exists and returns a dict
+            drive = usb_manager.get_drive_info(drive_path)
+            if "error" not in drive:
+                self._drive_info_cache = {key: drive}
+        return drive
+
+    def get_usb_info(self, drive_path: str, device=None) -> dict:
         """Fetches detailed information for a specific USB drive."""
         if not drive_path:
             return {}
         try:
-            # Assuming usb_manager.get_drive_info exists and returns a dict
-            drive = usb_manager.get_drive_info(drive_path)
-            total_gb = drive.get('total', 0) / (1024**3)
-            free_gb = drive.get('free', 0) / (1024**3)
+            drive = self._drive_details(drive_path, device)
+            if "error" in drive:
+                total, free = drive.get('total', 0), drive.get('free', 0)
+            else:
+                # Capacity is the only part that changes while the drive stays plugged in
+                usage = shutil.disk_usage(drive_path)
+                total, free = usage.total, usage.free
+            total_gb = total / (1024**3)
+            free_gb = free / (1024**3)
             return {
                 "drive_path": drive_path,
                 "serial_number": drive.get('serial', 'N/A'),
@@ -69,8 +110,9 @@ class DataCollector:
         usb_dir = os.path.join(drive_path, ".ursafe", "chunks") if drive_path else ""
 
         try:
-            host_files = glob.glob(os.path.join(host_dir, ".c_*"))
-            usb_files = glob.glob(os.path.join(usb_dir, ".c_*")) if drive_path else []
+            # One directory pass each; DirEntry names are already basenames
+            host_files = _chunk_names(host_dir)
+            usb_files = _chunk_names(usb_dir) if drive_path else []
             
             host_available = len(host_files)
             usb_available = len(usb_files)
@@ -81,10 +123,10 @@ class DataCollector:
                 "required_shares": chunk_manager.DEFAULT_REQUIRED_SHARES,
                 "host_location": host_dir,
                 "host_available": host_available,
-                "host_files": [os.path.basename(f) for f in host_files],
+                "host_files": host_files,
                 "usb_location": usb_dir,
                 "usb_available": usb_available,
-                "usb_files": [os.path.basename(f) for f in usb_files],
+                "usb_files": usb_files,
                 "reconstruction_possible": total_available >= chunk_manager.DEFAULT_REQUIRED_SHARES
             }
         except Exception as e:
@@ -95,12 +137,23 @@ class DataCollector:
         """Fetches and verifies the entire log chain from the USB."""
         if not drive_path or not usb_manager.verify_stick(drive_path):
             return []
+        log_path = os.path.join(drive_path, log_manager.URSAFE_DIR, log_manager.LOG_FILENAME)
         try:
+            try:
+                stat = os.stat(log_path)
+                key = (log_path, stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                key = (log_path, None, None)
+            cached = self._log_cache.get(key)
+            if cached is not None:
+                return cached
+
             logs = log_manager.get_log_chain(drive_path)
             is_valid = log_manager.verify_log_chain(drive_path)
             
             for entry in logs:
                 entry['verified'] = is_valid
+            self._log_cache = {key: logs}
             return logs
         except Exception as e:
             print(f"Error getting log chain: {e}")
@@ -110,15 +163,19 @@ class DataCollector:
         """
         Fetches all data points required for the secondary dashboard.
         """
-        active_usb_list = usb_manager.find_usb_drives()
-        drive_path = active_usb_list[0]['mountpoint'] if active_usb_list else None
-
-        all_data = {
-            "system_info": self.get_system_info(),
-            "usb_info": self.get_usb_info(drive_path),
-            "chunk_status": self.get_chunk_status(drive_path),
-            "log_chain": self.get_log_chain(drive_path)
+        # Shares the vault tab's recent scan instead of enumerating again
+        active_usb_list = drive_cache.get_drives()
+        drive = active_usb_list[0] if active_usb_list else {}
+        drive_path = drive.get('mountpoint')
+
+        futures = {
+            "system_info": self._pool.submit(self.get_system_info),
+            "usb_info": self._pool.submit(self.get_usb_info, drive_path, drive.get('device')),
+            "chunk_status": self._pool.submit(self.get_chunk_status, drive_path),
+            "log_chain": self._pool.submit(self.get_log_chain, drive_path)
         }
+        # Each query catches its own errors, so result() only waits
+        all_data = {name: future.result() for name, future in futures.items()}
         return all_data
 
 # The test block remains the same
@@ -126,6 +183,16 @@ if __name__ == '__main__':
     print("--- Running Data Collector Test ---")
     collector = DataCollector()
     live_data = collector.fetch_all_data()
-    print(json.dumps(live_data, indent=4))
+    # orjson is optional; it serializes in C instead of json's Python-level indenting writer
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(live_data, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(live_data, indent=2))
     print("\n--- Test Complete ---")
     # ... (rest of the test script)
\ No newline at end of file
@@ -0,0 +1,54 @@
+# file: dashboard/utils/drive_cache.py
+
+import os
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from ursafe_sdk.usb_manager import find_usb_drives, invalidate_partitions
+
+# How long a drive enumeration is reused before re-scanning (seconds)
+DEFAULT_MAX_AGE = 2.0
+
+# One process-wide result shared by the vault tab, its scan worker and the technical dashboard.
+# The lock also makes concurrent callers wait for a scan in progress instead of starting their own.
+_lock = threading.Lock()
+_timestamp = None
+_drives = []
+_mountpoints = frozenset()
+
+def peek(max_age: float = DEFAULT_MAX_AGE):
+    """Returns the cached drive list if it is younger than max_age, otherwise None. Never scans."""
+    with _lock:
+        if _timestamp is not None and time.monotonic() - _timestamp < max_age:
+            return _drives
+        return None
+
+def get_drives(max_age: float = DEFAULT_MAX_AGE) -> list:
+    """Returns the cached drive list, re-running find_usb_drives() if it is older than max_age."""
+    global _timestamp, _drives, _mountpoints
+    with _lock:
+        if _timestamp is None or time.monotonic() - _timestamp >= max_age:
+            _drives = find_usb_drives()
+            _mountpoints = frozenset(drive['mountpoint'] for drive in _drives)
+            _timestamp = time.monotonic()
+        return _drives
+
+def mountpoints(drives: list) -> frozenset:
+    """Returns the mountpoints of a drive list as a frozenset, reusing the one built with the cached scan."""
+    # Read both together: a rescan on another thread replaces them as a pair
+    with _lock:
+        if drives is _drives:
+            return _mountpoints
+    return frozenset(drive['mountpoint'] for drive in drives)
+
+def invalidate():
+    """Forces the next get_drives() call to re-scan (refresh button, hotplug events)."""
+    global _timestamp
+    with _lock:
+        _timestamp = None
+    invalidate_partitions()
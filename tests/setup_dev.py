@@ -18,18 +18,28 @@ import sys
 import subprocess
 import platform
 
+_IS_WINDOWS = platform.system() == "Windows"
+# Python executable inside the project's venv
+_PY_EXE = os.path.join("venv", "Scripts", "python.exe") if _IS_WINDOWS else os.path.join("venv", "bin", "python")
+
 def run_command(cmd, description):
-    """Run a command and handle errors gracefully"""
+    """Run a command (an argv list, no shell) and handle errors gracefully"""
     print(f"📦 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
-        print(f"   Command: {cmd}")
+        print(f"   Command: {subprocess.list2cmdline(cmd)}")
         print(f"   Error: {e.stderr}")
         return False
+    except OSError as e:
+        # Without a shell, a missing executable raises here instead of failing with exit code 127
+        print(f"❌ {description} failed:")
+        print(f"   Command: {subprocess.list2cmdline(cmd)}")
+        print(f"   Error: {e}")
+        return False
 
 def check_python_version():
     """Verify Python version is 3.9+"""
@@ -49,28 +59,22 @@ def create_venv():
         return True
     
     return run_command(
-        f"{sys.executable} -m venv venv",
+        [sys.executable, "-m", "venv", "venv"],
         "Creating virtual environment"
     )
 
-def get_python_executable():
-    """Get the path to Python executable in venv"""
-    if platform.system() == "Windows":
-        return os.path.join("venv", "Scripts", "python.exe")
-    else:
-        return os.path.join("venv", "bin", "python")
-
 def install_requirements():
     """Install project requirements"""
-    python_exe = get_python_executable()
     return run_command(
-        f'"{python_exe}" -m pip install -r requirements.txt',
+        [_PY_EXE, "-m", "pip", "install", "-r", "requirements.txt"],
         "Installing project dependencies"
     )
 
+# Runs each script given on the command line as __main__, one after another, in one interpreter
+_RUN_SCRIPTS = "import runpy, sys; [runpy.run_path(path, run_name='__main__') for path in sys.argv[1:]]"
+
 def run_tests():
     """Run all module tests"""
-    python_exe = get_python_executable()
     tests = [
         ("ursafe_sdk/crypto_manager.py", "Cryptography tests"),
         ("ursafe_sdk/chunk_manager.py", "Secret sharing tests"),
@@ -79,20 +83,23 @@ def run_tests():
     print("\n🧪 Running Tests")
     print("=" * 50)
     
-    all_passed = True
+    test_files = []
     for test_file, description in tests:
         if os.path.exists(test_file):
-            print(f"\n🔍 {description}:")
-            success = run_command(
-                f'"{python_exe}" {test_file}',
-                f"Running {test_file}"
-            )
-            if not success:
-                all_passed = False
+            print(f"🔍 {description}: {test_file}")
+            test_files.append(test_file)
         else:
             print(f"⚠️  {test_file} not found, skipping")
     
-    return all_passed
+    if not test_files:
+        return True
+    
+    # One interpreter for all test files, so Python startup and the crypto imports happen once.
+    # The first failing test stops the run; its traceback names the file.
+    return run_command(
+        [_PY_EXE, "-c", _RUN_SCRIPTS, *test_files],
+        f"Running {len(test_files)} test file(s)"
+    )
 
 def main():
     print("🚀 UR Safe Stick - Development Setup")
@@ -128,7 +135,7 @@ def main():
     # Step 5: Show next steps
     print("\n📝 Next Steps:")
     print("   1. Activate virtual environment:")
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         print("      venv\\Scripts\\activate")
     else:
         print("      source venv/bin/activate")
@@ -1,12 +1,120 @@
 import os
 import platform
-from pyshamir import split, combine
+import secrets
+from functools import lru_cache
 
 # --- Constants ---
 # M-of-N strategy: We need M shares to reconstruct the secret out of N total shares.
 DEFAULT_REQUIRED_SHARES = 10
 DEFAULT_TOTAL_SHARES = 20
 
+# --- GF(256) Arithmetic ---
+# Same field and share layout as pyshamir (AES polynomial x^8 + x^4 + x^3 + x + 1; each
+# share is its y-bytes followed by one x-coordinate byte), so existing chunks stay readable.
+# Whole shares are processed at once: multiplying every byte by a constant is one
+# bytes.translate() call and adding (XOR) two byte strings is one big-integer XOR.
+
+def _build_gf_tables():
+    """Exp/log tables over the generator 3; exp is doubled so log sums need no modulo."""
+    exp = bytearray(510)
+    log = [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i] = exp[i + 255] = x
+        log[x] = i
+        # x *= 3, i.e. x ^ (x * 2) reduced by the field polynomial
+        x ^= ((x << 1) ^ (0x1B if x & 0x80 else 0)) & 0xFF
+    return bytes(exp), log
+
+_GF_EXP, _GF_LOG = _build_gf_tables()
+
+def _gf_mul(a: int, b: int) -> int:
+    if a == 0 or b == 0:
+        return 0
+    return _GF_EXP[_GF_LOG[a] + _GF_LOG[b]]
+
+def _gf_inv(a: int) -> int:
+    return _GF_EXP[255 - _GF_LOG[a]]
+
+@lru_cache(maxsize=256)
+def _mul_table(c: int) -> bytes:
+    """bytes.translate() table that multiplies each byte by c."""
+    if c == 0:
+        return bytes(256)
+    log_c = _GF_LOG[c]
+    return bytes([0]) + bytes(_GF_EXP[_GF_LOG[b] + log_c] for b in range(1, 256))
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+def _horner_eval(coefficients, x: int) -> int:
+    """Scalar reference: evaluates one byte's polynomial (lowest coefficient first) at x."""
+    acc = coefficients[-1]
+    for coefficient in reversed(coefficients[:-1]):
+        acc = _gf_mul(acc, x) ^ coefficient
+    return acc
+
+def _evaluate_shares(coefficients: list[bytes], xs) -> list[bytes]:
+    """Evaluates every byte's polynomial at each x; returns the shares (y-bytes + x byte)."""
+    shares = []
+    for x in xs:
+        table = _mul_table(x)
+        # _horner_eval over whole rows: acc = acc * x + coefficient
+        acc = coefficients[-1]
+        for coefficient in reversed(coefficients[:-1]):
+            acc = _xor(acc.translate(table), coefficient)
+        shares.append(acc + bytes([x]))
+    return shares
+
+def _split(secret: bytes, parts: int, threshold: int) -> list[bytes]:
+    """Shamir split of every byte of secret at once; shares are pyshamir-compatible."""
+    if parts < 2 or threshold < 2:
+        raise ValueError("Parts and threshold must be greater than 1")
+    if parts < threshold:
+        raise ValueError("Parts must be greater than threshold")
+    if parts > 255:
+        raise ValueError("Parts must be less than 256")
+    secret = bytes(secret)
+    # Row i holds coefficient i of every byte's polynomial; row 0 is the secret itself
+    coefficients = [secret] + [secrets.token_bytes(len(secret)) for _ in range(threshold - 1)]
+    # Distinct random non-zero x-coordinates, so repeated splits differ
+    xs = secrets.SystemRandom().sample(range(1, 256), parts)
+    return _evaluate_shares(coefficients, xs)
+
+@lru_cache(maxsize=16)
+def _lagrange_weights(xs: tuple) -> tuple:
+    """
+    Lagrange basis values at x=0 for the given x-coordinates: prod(x_j) / prod(x_i - x_j),
+    with the numerator and denominator accumulated separately so each share needs a single
+    inversion. Cached, since every unlock combines the same stored shares.
+    """
+    weights = []
+    for i, x_i in enumerate(xs):
+        numerator = denominator = 1
+        for j, x_j in enumerate(xs):
+            if j != i:
+                numerator = _gf_mul(numerator, x_j)
+                denominator = _gf_mul(denominator, x_i ^ x_j)
+        weights.append(_gf_mul(numerator, _gf_inv(denominator)))
+    return tuple(weights)
+
+def _combine(parts: list[bytes]) -> bytes:
+    """Lagrange interpolation at x=0 of every byte position at once."""
+    if parts is None or len(parts) < 2:
+        raise ValueError("Not enough parts to combine")
+    length = len(parts[0])
+    if length < 2:
+        raise ValueError("Part is too short")
+    if any(len(part) != length for part in parts):
+        raise ValueError("Parts are not the same length")
+    xs = tuple(part[-1] for part in parts)
+    if len(set(xs)) != len(xs):
+        raise ValueError("Duplicate sample")
+    secret = bytes(length - 1)
+    for part, weight in zip(parts, _lagrange_weights(xs)):
+        secret = _xor(secret, bytes(part[:-1]).translate(_mul_table(weight)))
+    return secret
+
 # --- Core Shamir's Secret Sharing Logic ---
 
 def split_master_key(master_key: bytes, m: int = DEFAULT_REQUIRED_SHARES, n: int = DEFAULT_TOTAL_SHARES) -> list[bytes]:
@@ -23,7 +131,7 @@ def split_master_key(master_key: bytes, m: int = DEFAULT_REQUIRED_SHARES, n: int
     """
     if len(master_key) == 0:
         raise ValueError("Master key cannot be empty.")
-    shares = split(master_key, n, m)
+    shares = _split(master_key, n, m)
     return shares
 
 def reconstruct_master_key(shares: list[bytes]) -> bytes:
@@ -40,19 +148,17 @@ def reconstruct_master_key(shares: list[bytes]) -> bytes:
         ValueError if reconstruction fails (e.g., not enough shares).
     """
     try:
-        master_key = combine(shares)
-        # Convert bytearray to bytes if needed
-        if isinstance(master_key, bytearray):
-            master_key = bytes(master_key)
-        return master_key
+        return _combine(shares)
     except Exception as e:
         raise ValueError(f"Failed to reconstruct secret. Not enough or invalid shares provided. Details: {e}")
 
 # --- Host Chunk File Management ---
 
+@lru_cache(maxsize=1)
 def get_host_chunk_dir() -> str:
     """
     Returns the appropriate hidden directory for storing host chunks based on the OS.
+    The location only depends on the OS, so it is resolved once per process.
     """
     if platform.system() == "Windows":
         # C:\ProgramData is a standard location for application data.
@@ -61,6 +167,35 @@ def get_host_chunk_dir() -> str:
         # /var/lib is common for persistent app data on Linux/macOS.
         return "/var/lib/.ursafe_chunks"
 
+# Chunk files are named .c_1 ... .c_N
+_CHUNK_PREFIX = ".c_"
+# Shares are written straight to fresh fds readable only by the owner
+_CHUNK_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                      | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+_CHUNK_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+def _write_file(path: str, data: bytes):
+    fd = os.open(path, _CHUNK_WRITE_FLAGS, 0o600)
+    try:
+        written = os.write(fd, data)
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+def _read_file(path: str) -> bytes:
+    fd = os.open(path, _CHUNK_READ_FLAGS)
+    try:
+        parts = []
+        # A share is a few dozen bytes, so the first read normally returns all of it
+        while True:
+            block = os.read(fd, 4096)
+            if not block:
+                return b"".join(parts)
+            parts.append(block)
+    finally:
+        os.close(fd)
+
 def save_host_chunks(shares: list[bytes]):
     """
     Saves a list of shares to the hidden host chunk directory.
@@ -73,11 +208,10 @@ def save_host_chunks(shares: list[bytes]):
         if platform.system() != "Windows":
             os.chmod(chunk_dir, 0o700) # Only owner can read/write/execute
             
-        for i, share in enumerate(shares):
-            # Using obscure filenames as per the spec
-            chunk_file_path = os.path.join(chunk_dir, f".c_{i+1}")
-            with open(chunk_file_path, "wb") as f:
-                f.write(share)
+        # Using obscure filenames as per the spec
+        chunk_path = os.path.join(chunk_dir, _CHUNK_PREFIX + "{}").format
+        for i, share in enumerate(shares, 1):
+            _write_file(chunk_path(i), share)
     except Exception as e:
         raise IOError(f"Could not save host chunks to '{chunk_dir}'. Check permissions. Details: {e}")
 
@@ -85,16 +219,18 @@ def load_host_chunks(num_chunks: int) -> list[bytes]:
     """
     Loads a specified number of shares from the host chunk directory.
     """
-    chunk_dir = get_host_chunk_dir()
-    loaded_shares = []
-    if not os.path.isdir(chunk_dir):
+    # One directory listing instead of an exists() check per expected chunk
+    try:
+        with os.scandir(get_host_chunk_dir()) as entries:
+            present = {entry.name: entry.path for entry in entries if entry.name.startswith(_CHUNK_PREFIX)}
+    except (FileNotFoundError, NotADirectoryError):
         return [] # Return empty list if directory doesn't exist
 
+    loaded_shares = []
     for i in range(1, num_chunks + 1):
-        chunk_file_path = os.path.join(chunk_dir, f".c_{i}")
-        if os.path.exists(chunk_file_path):
-            with open(chunk_file_path, "rb") as f:
-                loaded_shares.append(f.read())
+        chunk_file_path = present.get(f"{_CHUNK_PREFIX}{i}")
+        if chunk_file_path is not None:
+            loaded_shares.append(_read_file(chunk_file_path))
     
     return loaded_shares
 
@@ -125,6 +261,13 @@ if __name__ == '__main__':
     print(f"Reconstructed with 15 shares (hex): {reconstructed_key_more.hex()}")
     assert secret_key == reconstructed_key_more
     print("[OK] Reconstruction with more than minimum shares successful.")
+
+    # Cross-check the whole-row evaluation against the per-byte scalar reference
+    test_coefficients = [secret_key] + [os.urandom(len(secret_key)) for _ in range(9)]
+    for share in _evaluate_shares(test_coefficients, range(1, 256)):
+        x = share[-1]
+        assert all(share[b] == _horner_eval([row[b] for row in test_coefficients], x) for b in range(len(secret_key)))
+    print("[OK] Row-wise share evaluation matches the scalar reference for every x.")
     
     # Test for failure with insufficient shares
     insufficient_shares = all_shares[:9]
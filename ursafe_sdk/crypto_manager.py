@@ -1,7 +1,7 @@
 import os
+import hashlib
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives import hashes
 import argon2
 
 # --- Constants from Project Spec ---
@@ -10,6 +10,7 @@ ARGON2_MEMORY_COST = 65536  # 64 MiB
 ARGON2_PARALLELISM = 2
 AES_KEY_SIZE = 32  # 32 bytes = 256 bits
 AES_NONCE_SIZE = 12 # 12 bytes = 96 bits
+_ARGON2_TYPE = argon2.Type.ID
 
 # --- Symmetric Encryption: AES-256-GCM ---
 
@@ -26,6 +27,24 @@ def encrypt_aes_gcm(key: bytes, data: bytes) -> tuple:
     ciphertext = aesgcm.encrypt(nonce, data, None) # None for additional authenticated data
     return (nonce, ciphertext)
 
+def encrypt_many(key: bytes, items) -> list:
+    """
+    Encrypts several payloads under one key with AES-256-GCM, setting the cipher up once.
+    Returns a list of (nonce, ciphertext_with_tag) tuples, one per item, each with a fresh nonce.
+    """
+    if len(key) != AES_KEY_SIZE:
+        raise ValueError("Invalid AES key size.")
+    
+    aesgcm = AESGCM(key)
+    items = list(items)
+    # All nonces come from one urandom read, sliced per item; nothing is kept between calls
+    nonces = os.urandom(AES_NONCE_SIZE * len(items))
+    results = []
+    for offset, data in zip(range(0, len(nonces), AES_NONCE_SIZE), items):
+        nonce = nonces[offset:offset + AES_NONCE_SIZE]
+        results.append((nonce, aesgcm.encrypt(nonce, data, None)))
+    return results
+
 def decrypt_aes_gcm(key: bytes, nonce: bytes, encrypted_data: bytes) -> bytes:
     """
     Decrypts data using AES-256-GCM.
@@ -47,14 +66,9 @@ def decrypt_aes_gcm(key: bytes, nonce: bytes, encrypted_data: bytes) -> bytes:
 def derive_key_argon2(password: bytes, salt: bytes) -> bytes:
     """
     Derives a 32-byte key from a password and salt using Argon2id.
+    The cost is deliberate and not cached here; callers that need the same key
+    again should keep the derived key rather than call this twice.
     """
-    ph = argon2.PasswordHasher(
-        time_cost=ARGON2_TIME_COST,
-        memory_cost=ARGON2_MEMORY_COST,
-        parallelism=ARGON2_PARALLELISM,
-        hash_len=AES_KEY_SIZE,
-        salt_len=len(salt)
-    )
     # Use low-level hash function to get raw bytes instead of encoded string
     key = argon2.low_level.hash_secret_raw(
         secret=password,
@@ -63,7 +77,7 @@ def derive_key_argon2(password: bytes, salt: bytes) -> bytes:
         memory_cost=ARGON2_MEMORY_COST,
         parallelism=ARGON2_PARALLELISM,
         hash_len=AES_KEY_SIZE,
-        type=argon2.Type.ID
+        type=_ARGON2_TYPE
     )
     return key
 
@@ -83,6 +97,13 @@ def sign_data(private_key: ed25519.Ed25519PrivateKey, data: bytes) -> bytes:
     """
     return private_key.sign(data)
 
+def sign_many(private_key: ed25519.Ed25519PrivateKey, messages) -> list:
+    """
+    Signs several messages with one Ed25519 private key, in order.
+    """
+    sign = private_key.sign
+    return [sign(data) for data in messages]
+
 def verify_signature(public_key: ed25519.Ed25519PublicKey, signature: bytes, data: bytes) -> bool:
     """
     Verifies a signature using an Ed25519 public key.
@@ -100,9 +121,27 @@ def hash_sha256(data: bytes) -> bytes:
     """
     Computes the SHA-256 hash of the given data.
     """
-    digest = hashes.Hash(hashes.SHA256())
-    digest.update(data)
-    return digest.finalize()
+    # hashlib wraps the same OpenSSL SHA-256 without building a Hash context object per call
+    return hashlib.sha256(data).digest()
+
+# Read size for hash_file_sha256; memory use stays at one buffer whatever the file size
+_HASH_CHUNK_SIZE = 1 << 20
+
+def hash_file_sha256(path: str) -> bytes:
+    """
+    Computes the SHA-256 hash of a file's contents without loading the whole file.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, "file_digest"): # Python 3.11+
+            return hashlib.file_digest(f, "sha256").digest()
+        h = hashlib.sha256()
+        buf = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                return h.digest()
+            h.update(view[:n])
 
 # --- Self-Test Block ---
 if __name__ == '__main__':
@@ -137,6 +176,12 @@ if __name__ == '__main__':
     except ValueError:
         print("[OK] Decryption correctly failed with wrong key.")
 
+    batch = [b"first secret", b"second secret", b""]
+    sealed = encrypt_many(derived_key, batch)
+    assert [decrypt_aes_gcm(derived_key, n, c) for n, c in sealed] == batch
+    assert len({n for n, _ in sealed}) == len(batch)
+    print("[OK] Batch encryption round-trips with distinct nonces.")
+
     # 3. Test Ed25519 Digital Signatures
     print("\n[3] Testing Ed25519 Digital Signatures...")
     priv_key, pub_key = generate_ed25519_keys()
@@ -158,6 +203,11 @@ if __name__ == '__main__':
     assert not is_valid_wrong_key
     assert not is_valid_wrong_data
     print("[OK] Signature verification correctly failed for invalid cases.")
+
+    messages = [b"entry one", b"entry two"]
+    signatures = sign_many(priv_key, messages)
+    assert all(verify_signature(pub_key, sig, msg) for sig, msg in zip(signatures, messages))
+    print("[OK] Batch signing verified.")
     
     # 4. Test SHA-256 Hashing
     print("\n[4] Testing SHA-256 Hashing...")
@@ -166,4 +216,13 @@ if __name__ == '__main__':
     assert hash_result.hex() == "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
     print("[OK] Hashing Successful.")
 
+    import tempfile
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(b"hello world")
+    try:
+        assert hash_file_sha256(tmp.name) == hash_result
+    finally:
+        os.remove(tmp.name)
+    print("[OK] File hashing matches in-memory hashing.")
+
     print("\n--- All crypto_manager tests passed! ---")
\ No newline at end of file
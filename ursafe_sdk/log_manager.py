@@ -5,15 +5,59 @@ Integrates with crypto_manager for proper hashing and signatures.
 """
 import json
 import os
-from datetime import datetime
+import time
 from . import crypto_manager
 
 LOG_FILENAME = "logchain.json"
 URSAFE_DIR = ".ursafe"
 
+# Entry hashes are taken over json.dumps(entry, sort_keys=True) as UTF-8. Existing chains
+# depend on exactly these bytes, so the format (default separators, ASCII escapes) must
+# not change. One shared encoder gives identical output without json.dumps building a
+# new JSONEncoder on every call with non-default options.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True)
+
+def _canonical_bytes(entry: dict) -> bytes:
+    """The bytes an entry's current_hash (and signature) is computed over."""
+    return _CANONICAL_ENCODER.encode(entry).encode('utf-8')
+
+def iso_from_ns(timestamp_ns: int) -> str:
+    """
+    Formats an entry timestamp (integer UTC nanoseconds) the way older entries stored it,
+    e.g. '2025-10-05T10:30:00.123456'. For display only; entries keep the integer.
+    """
+    from datetime import datetime, timezone
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    moment = datetime.fromtimestamp(seconds, timezone.utc)
+    return moment.replace(tzinfo=None, microsecond=remainder // 1000).isoformat()
+
+# How much of the log end get_previous_hash reads first; doubled until a whole line fits
+_TAIL_CHUNK = 4096
+
+def _read_last_line(log_file_path):
+    """Returns the last non-empty line of the file as bytes (b"" if there is none), reading from the end."""
+    with open(log_file_path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        chunk = _TAIL_CHUNK
+        while True:
+            start = max(0, size - chunk)
+            f.seek(start)
+            tail = f.read(size - start).rstrip()
+            cut = tail.rfind(b"\n")
+            # A newline inside the tail means the last line is complete; at offset 0 the whole file is
+            if cut >= 0 or start == 0:
+                return tail[cut + 1:].strip()
+            chunk *= 2
+
+# log path -> (size, mtime_ns, current_hash) of the file right after this process last
+# appended to it. A matching stat means nothing else has written since, so the next
+# entry can chain to the remembered hash without reading the file.
+_last_hash_by_path = {}
+
 def get_previous_hash(log_file_path):
     """
     Gets the hash of the last log entry for blockchain chaining.
+    Only the end of the file is read, so appends cost the same however long the log is.
     
     Returns:
         str: Hex string of previous entry hash, or "genesis" for first entry
@@ -22,46 +66,21 @@ def get_previous_hash(log_file_path):
         return "genesis"
     
     try:
-        with open(log_file_path, 'r') as f:
-            lines = f.readlines()
-            if not lines:
-                return "genesis"
-            
-            # Get the last entry and use its stored current_hash
-            last_entry = lines[-1].strip()
-            if last_entry:
-                entry = json.loads(last_entry)
-                return entry.get("current_hash", "genesis")
-            else:
-                return "genesis"
+        last_entry = _read_last_line(log_file_path)
+        if not last_entry:
+            return "genesis"
+
+        # Use the last entry's stored current_hash
+        entry = json.loads(last_entry)
+        return entry.get("current_hash", "genesis")
     except Exception:
         return "genesis"
 
-def add_log_entry(drive_path, action_description, signing_key=None):
-    """
-    Creates a new blockchain-style log entry with proper hashing and signatures.
-
-    Args:
-        drive_path (str): The mount point of the USB stick (e.g., 'E:\\').
-        action_description (str): A human-readable string of the action performed.
-        signing_key: Ed25519 private key for signing (optional for now)
-    
-    Returns:
-        bool: True if successful, False otherwise.
-    """
-    log_file_path = os.path.join(drive_path, URSAFE_DIR, LOG_FILENAME)
-
-    # Ensure .ursafe directory exists
-    ursafe_dir = os.path.join(drive_path, URSAFE_DIR)
-    if not os.path.isdir(ursafe_dir):
-        print(f"Error: UR Safe directory not found at {drive_path}")
-        return False
-
-    # Get previous hash for blockchain chaining
-    prev_hash = get_previous_hash(log_file_path)
-    
-    # Create the log entry
-    timestamp = datetime.utcnow().isoformat()
+def _build_entry(action_description, prev_hash, signing_key=None):
+    """Creates one hashed (and optionally signed) log entry chained to prev_hash."""
+    # Integer nanoseconds since the epoch (UTC); older entries hold an ISO string instead.
+    # Either way the stored value is what gets hashed, so mixed chains still verify.
+    timestamp = time.time_ns()
     entry_data = {
         "timestamp": timestamp,
         "action": action_description,
@@ -69,8 +88,7 @@ def add_log_entry(drive_path, action_description, signing_key=None):
     }
     
     # Convert to JSON for hashing and signing
-    entry_json = json.dumps(entry_data, sort_keys=True)
-    entry_bytes = entry_json.encode('utf-8')
+    entry_bytes = _canonical_bytes(entry_data)
     
     # Calculate current entry hash
     current_hash = crypto_manager.hash_sha256(entry_bytes)
@@ -88,17 +106,95 @@ def add_log_entry(drive_path, action_description, signing_key=None):
     
     # Add the current hash to the entry
     entry_data["current_hash"] = current_hash.hex()
+    return entry_data
+
+# Raw append: no Python buffering layer, and the kernel positions every write at the end
+_LOG_FLAGS = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+              | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+
+def _append_lines(log_file_path, lines):
+    """
+    Appends pre-encoded lines with as few syscalls as possible: one os.writev for the
+    whole batch where available, otherwise one os.write of the joined bytes.
+    Returns the os.stat_result of the file after the write.
+    """
+    fd = os.open(log_file_path, _LOG_FLAGS, 0o600)
+    try:
+        data = b"".join(lines)
+        if hasattr(os, "writev") and len(lines) > 1:
+            written = os.writev(fd, lines)
+        else:
+            written = os.write(fd, data)
+        # Short writes are rare for a local file, but finish the record if one happens
+        while written < len(data):
+            written += os.write(fd, data[written:])
+        return os.fstat(fd)
+    finally:
+        os.close(fd)
+
+def add_log_entries(drive_path, action_descriptions, signing_key=None):
+    """
+    Appends several chained log entries with a single write.
+
+    Args:
+        drive_path (str): The mount point of the USB stick (e.g., 'E:\\').
+        action_descriptions (list[str]): Human-readable actions, oldest first.
+        signing_key: Ed25519 private key for signing (optional for now)
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    log_file_path = os.path.join(drive_path, URSAFE_DIR, LOG_FILENAME)
+
+    # Ensure .ursafe directory exists
+    ursafe_dir = os.path.join(drive_path, URSAFE_DIR)
+    if not os.path.isdir(ursafe_dir):
+        print(f"Error: UR Safe directory not found at {drive_path}")
+        return False
+
+    # Get previous hash for blockchain chaining; entries in the batch chain to each other
+    prev_hash = None
+    cached = _last_hash_by_path.get(log_file_path)
+    if cached is not None:
+        try:
+            st = os.stat(log_file_path)
+            if (st.st_size, st.st_mtime_ns) == cached[:2]:
+                prev_hash = cached[2]
+        except OSError:
+            pass
+    if prev_hash is None:
+        prev_hash = get_previous_hash(log_file_path)
+    lines = []
+    for action_description in action_descriptions:
+        entry_data = _build_entry(action_description, prev_hash, signing_key)
+        prev_hash = entry_data["current_hash"]
+        # Each record is built whole in memory (one JSON object per line)
+        lines.append((json.dumps(entry_data) + "\n").encode('utf-8'))
 
     try:
-        # Append to log file (one JSON object per line)
-        with open(log_file_path, 'a') as f:
-            f.write(json.dumps(entry_data) + "\n")
-        print(f"Successfully logged action: '{action_description}'")
+        st = _append_lines(log_file_path, lines)
+        _last_hash_by_path[log_file_path] = (st.st_size, st.st_mtime_ns, prev_hash)
+        for action_description in action_descriptions:
+            print(f"Successfully logged action: '{action_description}'")
         return True
     except Exception as e:
         print(f"Error writing to log file: {e}")
         return False
 
+def add_log_entry(drive_path, action_description, signing_key=None):
+    """
+    Creates a new blockchain-style log entry with proper hashing and signatures.
+
+    Args:
+        drive_path (str): The mount point of the USB stick (e.g., 'E:\\').
+        action_description (str): A human-readable string of the action performed.
+        signing_key: Ed25519 private key for signing (optional for now)
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    return add_log_entries(drive_path, [action_description], signing_key)
+
 def verify_log_chain(drive_path):
     """
     Verifies the integrity of the entire log chain.
@@ -112,35 +208,39 @@ def verify_log_chain(drive_path):
         return True  # Empty log is valid
     
     try:
-        with open(log_file_path, 'r') as f:
-            lines = f.readlines()
-        
         previous_hash = "genesis"
-        
-        for i, line in enumerate(lines):
-            if not line.strip():
-                continue
-                
-            entry = json.loads(line.strip())
-            
-            # Verify the previous hash matches
-            if entry.get("prev_hash") != previous_hash:
-                print(f"Log chain broken at entry {i}: prev_hash mismatch")
-                return False
-            
-            # Verify the current hash
-            entry_for_hash = {k: v for k, v in entry.items() if k not in ["signature", "current_hash"]}
-            entry_bytes = json.dumps(entry_for_hash, sort_keys=True).encode('utf-8')
-            calculated_hash = crypto_manager.hash_sha256(entry_bytes).hex()
-            
-            if entry.get("current_hash") != calculated_hash:
-                print(f"Log entry {i} has invalid hash")
-                return False
-            
-            # Update for next iteration
-            previous_hash = calculated_hash
-        
-        print(f"Log chain verified: {len(lines)} entries valid")
+        line_count = 0
+        loads = json.loads
+        hash_sha256 = crypto_manager.hash_sha256
+
+        # Streamed line by line, so memory stays flat however long the chain gets
+        with open(log_file_path, 'r') as f:
+            for line_count, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                entry = loads(line)
+
+                # Verify the previous hash matches
+                if entry.get("prev_hash") != previous_hash:
+                    print(f"Log chain broken at entry {line_count - 1}: prev_hash mismatch")
+                    return False
+
+                # Verify the current hash. The entry is ours, so dropping the two unhashed
+                # fields in place leaves exactly the hashed fields (any extra ones included)
+                stored_hash = entry.pop("current_hash", None)
+                entry.pop("signature", None)
+                calculated_hash = hash_sha256(_canonical_bytes(entry)).hex()
+
+                if stored_hash != calculated_hash:
+                    print(f"Log entry {line_count - 1} has invalid hash")
+                    return False
+
+                # Update for next iteration
+                previous_hash = calculated_hash
+
+        print(f"Log chain verified: {line_count} entries valid")
         return True
         
     except Exception as e:
@@ -219,7 +319,7 @@ if __name__ == '__main__':
     print("\n[4] Log Chain Contents:")
     for i, entry in enumerate(entries):
         print(f"   Entry {i+1}: {entry['action']}")
-        print(f"   Timestamp: {entry['timestamp']}")
+        print(f"   Timestamp: {iso_from_ns(entry['timestamp'])}")
         print(f"   Hash: {entry['current_hash'][:16]}...")
     
     # Cleanup
@@ -9,28 +9,57 @@ Generates stable hardware identifiers for device authentication.
 import os
 import platform
 import hashlib
+import hmac
 import subprocess
 from . import crypto_manager
 
+# Constant for the life of the process
+_SYSTEM = platform.system()
+
 def get_system_fingerprint() -> bytes:
     """
     Generate a stable hardware fingerprint for the current system.
     
     This combines various hardware identifiers into a single hash.
     WARNING: Hardware changes may cause lockout - implement recovery!
+    A fingerprint built from the hardware identifiers is kept for the rest of the
+    process (see invalidate_fingerprint_cache()); one that needed a fallback is not,
+    so a transient query failure only affects that one call.
     
     Returns:
         32-byte SHA-256 hash of system characteristics
     """
+    global _cached_fingerprint
+    fingerprint = _cached_fingerprint
+    if fingerprint is None:
+        fingerprint, fell_back = _compute_fingerprint()
+        if not fell_back:
+            _cached_fingerprint = fingerprint
+    return fingerprint
+
+def invalidate_fingerprint_cache():
+    """Makes the next get_system_fingerprint() call query the hardware again."""
+    global _cached_fingerprint
+    _cached_fingerprint = None
+
+# Set by get_system_fingerprint() once the hardware query has succeeded
+_cached_fingerprint = None
+
+def _compute_fingerprint() -> tuple:
+    """
+    Collects the hardware identifiers (spawning wmic/system_profiler where needed) and hashes them.
+    Returns (fingerprint, fell_back), fell_back being True if any identifier had to be replaced.
+    """
     fingerprint_data = []
+    fell_back = False
     
     # Platform information
-    fingerprint_data.append(platform.system().encode())
+    fingerprint_data.append(_SYSTEM.encode())
     fingerprint_data.append(platform.machine().encode())
     
     try:
         # CPU information (cross-platform)
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             # Windows-specific identifiers
             try:
                 # Get processor ID
@@ -52,8 +81,9 @@ def get_system_fingerprint() -> bytes:
             except (subprocess.CalledProcessError, Exception):
                 # Fallback to username if hardware info fails
                 fingerprint_data.append(os.getenv('USERNAME', 'unknown').encode())
+                fell_back = True
                 
-        elif platform.system() == "Linux":
+        elif _SYSTEM == "Linux":
             # Linux-specific identifiers
             try:
                 # Machine ID
@@ -67,8 +97,9 @@ def get_system_fingerprint() -> bytes:
                 except (FileNotFoundError, PermissionError):
                     # Fallback to hostname
                     fingerprint_data.append(platform.node().encode())
+                    fell_back = True
                     
-        elif platform.system() == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             try:
                 # Hardware UUID
                 hw_uuid = subprocess.check_output(
@@ -83,18 +114,20 @@ def get_system_fingerprint() -> bytes:
             except (subprocess.CalledProcessError, Exception):
                 # Fallback to hostname
                 fingerprint_data.append(platform.node().encode())
+                fell_back = True
                 
     except Exception as e:
         # Ultimate fallback: use username + hostname
         fingerprint_data.append(os.getenv('USER', os.getenv('USERNAME', 'unknown')).encode())
         fingerprint_data.append(platform.node().encode())
+        fell_back = True
         print(f"[WARN] Hardware fingerprinting fallback used: {e}")
     
     # Combine all fingerprint data
     combined_data = b'|'.join(fingerprint_data)
     
     # Hash to create stable 32-byte fingerprint
-    return crypto_manager.hash_sha256(combined_data)
+    return crypto_manager.hash_sha256(combined_data), fell_back
 
 def get_system_info() -> dict:
     """
@@ -104,7 +137,7 @@ def get_system_info() -> dict:
         Dictionary with system information
     """
     return {
-        'platform': platform.system(),
+        'platform': _SYSTEM,
         'platform_version': platform.version(),
         'architecture': platform.machine(),
         'processor': platform.processor(),
@@ -123,7 +156,8 @@ def verify_system_fingerprint(stored_fingerprint: bytes) -> bool:
         True if fingerprints match, False otherwise
     """
     current_fingerprint = get_system_fingerprint()
-    return current_fingerprint == stored_fingerprint
+    # Constant-time, so the comparison does not leak how much of the digest matched
+    return hmac.compare_digest(current_fingerprint, stored_fingerprint)
 
 def get_hardware_info() -> dict:
     """
@@ -150,6 +184,10 @@ if __name__ == '__main__':
     assert fingerprint1 == fingerprint2
     assert len(fingerprint1) == 32  # SHA-256 is 32 bytes
     print("[OK] Fingerprint generation is consistent and correct length.")
+
+    invalidate_fingerprint_cache()
+    assert get_system_fingerprint() == fingerprint1
+    print("[OK] Fingerprint is unchanged after re-querying the hardware.")
     
     # 2. Test System Info
     print("\n[2] Testing System Information...")
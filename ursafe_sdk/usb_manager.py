@@ -5,11 +5,19 @@ Manages detecting, identifying, and verifying USB devices.
 import psutil
 import os
 import json
+import hmac
 import platform
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from . import crypto_manager
 from . import system_utils
 
+# Constant for the life of the process
+_SYSTEM = platform.system()
+_IS_NT = os.name == 'nt'
+
 def get_usb_signature(drive_path):
     """
     Gets a unique, stable identifier for a USB drive.
@@ -21,7 +29,7 @@ def get_usb_signature(drive_path):
         str: Unique identifier for the USB drive, or None if failed
     """
     try:
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             # Get volume serial number on Windows
             import ctypes
             volume_serial = ctypes.c_ulong()
@@ -32,14 +40,14 @@ def get_usb_signature(drive_path):
             if success:
                 return f"WIN-{volume_serial.value:08X}"
                 
-        elif platform.system() == "Linux":
+        elif _SYSTEM == "Linux":
             # Try to get device UUID on Linux
             result = subprocess.run(['blkid', '-s', 'UUID', '-o', 'value', drive_path], 
                                   capture_output=True, text=True)
             if result.returncode == 0 and result.stdout.strip():
                 return f"LINUX-{result.stdout.strip()}"
                 
-        elif platform.system() == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             # Try to get volume UUID on macOS
             result = subprocess.run(['diskutil', 'info', drive_path], 
                                   capture_output=True, text=True)
@@ -54,6 +62,27 @@ def get_usb_signature(drive_path):
     # Fallback: use drive path
     return f"FALLBACK-{abs(hash(drive_path))}"
 
+def signatures_match(stored_signature, current_signature) -> bool:
+    """Constant-time equality for USB signature strings (non-strings fall back to ==)."""
+    if isinstance(stored_signature, str) and isinstance(current_signature, str):
+        return hmac.compare_digest(stored_signature.encode('utf-8'), current_signature.encode('utf-8'))
+    return stored_signature == current_signature
+
+def get_usb_signatures(drive_paths) -> dict:
+    """
+    get_usb_signature() for several drives at once, as {drive_path: signature}.
+    Each lookup may spawn blkid/diskutil, so they run concurrently.
+    """
+    drive_paths = list(drive_paths)
+    if len(drive_paths) < 2:
+        return {path: get_usb_signature(path) for path in drive_paths}
+    with ThreadPoolExecutor(max_workers=min(8, len(drive_paths))) as pool:
+        return dict(zip(drive_paths, pool.map(get_usb_signature, drive_paths)))
+
+# What a .ursafe directory and its meta.json must contain to count as a UR Safe Stick
+_REQUIRED_FILES = ("vault.enc", "meta.json")
+_REQUIRED_META_FIELDS = ("salt_hex", "usb_chunks_hex", "system_fingerprint_hex")
+
 def verify_stick(drive_path):
     """
     Verifies if a given drive is an initialized UR Safe Stick with cryptographic validation.
@@ -64,18 +93,26 @@ def verify_stick(drive_path):
     Returns:
         dict: Verification result with status and details
     """
-    if not drive_path or not os.path.isdir(drive_path):
+    if not drive_path:
         return {"valid": False, "reason": "Drive path invalid"}
 
+    # One directory listing answers "is there a .ursafe dir" and "are the files in it";
+    # the drive path itself is only stat'ed to explain a failure
     ursafe_path = os.path.join(drive_path, ".ursafe")
-    if not os.path.isdir(ursafe_path):
+    try:
+        with os.scandir(ursafe_path) as entries:
+            present = {os.path.normcase(entry.name) for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        if not os.path.isdir(drive_path):
+            return {"valid": False, "reason": "Drive path invalid"}
         return {"valid": False, "reason": "Not a UR Safe Stick (no .ursafe directory)"}
+    except OSError as e:
+        return {"valid": False, "reason": f"Verification error: {e}"}
     
     # Check for required files
-    required_files = ["vault.enc", "meta.json"]
-    for filename in required_files:
-        if not os.path.exists(os.path.join(ursafe_path, filename)):
-            return {"valid": False, "reason": f"Missing required file: {filename}"}
+    missing = [filename for filename in _REQUIRED_FILES if os.path.normcase(filename) not in present]
+    if missing:
+        return {"valid": False, "reason": f"Missing required file: {', '.join(missing)}"}
     
     try:
         # Verify metadata structure
@@ -83,23 +120,22 @@ def verify_stick(drive_path):
         with open(meta_file, 'r') as f:
             metadata = json.load(f)
         
-        required_fields = ["salt_hex", "usb_chunks_hex", "system_fingerprint_hex"]
-        for field in required_fields:
-            if field not in metadata:
-                return {"valid": False, "reason": f"Invalid metadata: missing {field}"}
+        missing = [field for field in _REQUIRED_META_FIELDS if field not in metadata]
+        if missing:
+            return {"valid": False, "reason": f"Invalid metadata: missing {', '.join(missing)}"}
         
         # Verify USB signature if stored
         usb_sig = get_usb_signature(drive_path)
         stored_sig = metadata.get("usb_signature")
         
-        if stored_sig and stored_sig != usb_sig:
+        if stored_sig and not signatures_match(stored_sig, usb_sig):
             return {"valid": False, "reason": "USB signature mismatch - possible clone"}
         
         # Verify system fingerprint
         stored_fp = bytes.fromhex(metadata["system_fingerprint_hex"])
         current_fp = system_utils.get_system_fingerprint()
         
-        fp_match = stored_fp == current_fp
+        fp_match = hmac.compare_digest(stored_fp, current_fp)
         
         return {
             "valid": True,
@@ -111,6 +147,45 @@ def verify_stick(drive_path):
         
     except Exception as e:
         return {"valid": False, "reason": f"Verification error: {e}"}
+# Partition tables are re-read at most this often (seconds); drive polling asks far more often
+PARTITIONS_MAX_AGE = 0.5
+
+_partitions_lock = threading.Lock()
+_partitions_timestamp = None
+_partitions = ()
+_partitions_by_mountpoint = {}
+
+def _refresh_partitions():
+    """Re-reads the partition table if the cached copy is older than PARTITIONS_MAX_AGE. Caller holds the lock."""
+    global _partitions_timestamp, _partitions, _partitions_by_mountpoint
+    now = time.monotonic()
+    if _partitions_timestamp is None or now - _partitions_timestamp >= PARTITIONS_MAX_AGE:
+        _partitions = tuple(psutil.disk_partitions(all=True))
+        index = {}
+        for partition in _partitions:
+            # The first partition listed for a mountpoint wins, as in a linear scan
+            index.setdefault(partition.mountpoint, partition)
+        _partitions_by_mountpoint = index
+        _partitions_timestamp = now
+
+def _disk_partitions():
+    """psutil.disk_partitions(all=True), reused for PARTITIONS_MAX_AGE seconds."""
+    with _partitions_lock:
+        _refresh_partitions()
+        return _partitions
+
+def _partition_index():
+    """{mountpoint: partition} for the same cached partition list as _disk_partitions()."""
+    with _partitions_lock:
+        _refresh_partitions()
+        return _partitions_by_mountpoint
+
+def invalidate_partitions():
+    """Makes the next drive lookup re-read the partition table (e.g. after a hotplug event)."""
+    global _partitions_timestamp
+    with _partitions_lock:
+        _partitions_timestamp = None
+
 def find_usb_drives():
     """
     Detects all removable USB storage devices connected to the system.
@@ -121,21 +196,20 @@ def find_usb_drives():
               Example: [{'device': 'E:\\', 'mountpoint': 'E:\\'}]
     """
     removable_drives = []
-    partitions = psutil.disk_partitions(all=True)
-    for p in partitions:
-        # 'removable' is a good indicator on Windows. On Linux/macOS,
-        # we can also check if 'opts' contains 'removable' or if the
-        # device path includes 'usb'.
-        is_removable = 'removable' in p.opts or 'usb' in p.device.lower()
-        
-        # On Windows, psutil might not always populate 'removable'.
-        # A fallback is to check if the drive type is 'removable'.
-        # This part is a bit more platform-specific.
-        if os.name == 'nt' and 'fixed' not in p.opts:
-             is_removable = True # A simplification for our project
-
-        if is_removable and p.mountpoint:
-            # We only care about drives that are actually mounted and accessible
+    for p in _disk_partitions():
+        # We only care about drives that are actually mounted and accessible
+        if not p.mountpoint:
+            continue
+
+        # On Windows, psutil might not always populate 'removable', so any
+        # drive that is not 'fixed' counts (a simplification for our project)
+        # and is decided without the other checks. On Linux/macOS, 'opts'
+        # containing 'removable' or the device path including 'usb' does.
+        is_removable = ((_IS_NT and 'fixed' not in p.opts)
+                        or 'removable' in p.opts
+                        or 'usb' in p.device.lower())
+
+        if is_removable:
             removable_drives.append({
                 "device": p.device,
                 "mountpoint": p.mountpoint
@@ -161,12 +235,7 @@ def get_drive_info(drive_path: str) -> dict:
         usage = psutil.disk_usage(drive_path)
         
         # Get drive info from partitions
-        partitions = psutil.disk_partitions(all=True)
-        drive_info = None
-        for partition in partitions:
-            if partition.mountpoint == drive_path:
-                drive_info = partition
-                break
+        drive_info = _partition_index().get(drive_path)
         
         result = {
             "total": usage.total,
@@ -189,11 +258,12 @@ if __name__ == '__main__':
     print("\n[1] Testing USB drive detection...")
     drives = find_usb_drives()
     print(f"Found {len(drives)} removable drives:")
+    signatures = get_usb_signatures(drive['mountpoint'] for drive in drives)
     for i, drive in enumerate(drives):
         print(f"  {i+1}. Device: {drive['device']}, Mount Point: {drive['mountpoint']}")
         
         # Test USB signature
-        signature = get_usb_signature(drive['mountpoint'])
+        signature = signatures[drive['mountpoint']]
         print(f"     USB Signature: {signature}")
         
         # Test verification
@@ -1,11 +1,16 @@
 import os
 import json
+import hmac
 
 # Import the modules we just built
 from . import crypto_manager
 from . import chunk_manager
 from . import system_utils
 
+def _key_material(pin: str, usb_salt: bytes, host_secret_blob: bytes, fingerprint: bytes) -> bytes:
+    """The Argon2 input for the vault key: PIN, USB salt, host secret and system fingerprint, in that order."""
+    return b"".join((pin.encode('utf-8'), usb_salt, host_secret_blob, fingerprint))
+
 class VaultManager:
     """
     Manages high-level vault operations like initialization, unlocking, and locking.
@@ -18,6 +23,24 @@ class VaultManager:
         self.ursafe_dir = os.path.join(self.usb_path, ".ursafe")
         self.vault_file = os.path.join(self.ursafe_dir, "vault.enc")
         self.meta_file = os.path.join(self.ursafe_dir, "meta.json")
+        # ((size, mtime_ns) of meta.json, metadata, usb_salt, usb_chunks); see _read_metadata
+        self._metadata_cache = None
+
+    def _read_metadata(self):
+        """
+        Returns (metadata, usb_salt, usb_chunks) from meta.json. The parsed and hex-decoded
+        values are kept until the file changes, so PIN retries skip the decoding.
+        """
+        st = os.stat(self.meta_file)
+        stamp = (st.st_size, st.st_mtime_ns)
+        cached = self._metadata_cache
+        if cached is None or cached[0] != stamp:
+            with open(self.meta_file, 'r') as f:
+                metadata = json.load(f)
+            usb_salt = bytes.fromhex(metadata['salt_hex'])
+            usb_chunks = tuple(bytes.fromhex(chunk) for chunk in metadata['usb_chunks_hex'])
+            cached = self._metadata_cache = (stamp, metadata, usb_salt, usb_chunks)
+        return cached[1:]
 
     def initialize_vault(self, pin: str):
         """
@@ -49,12 +72,13 @@ class VaultManager:
         }
         with open(self.meta_file, 'w') as f:
             json.dump(metadata, f)
+        self._metadata_cache = None
         
         # Include the fingerprint in the key derivation material
-        key_material = pin.encode('utf-8') + usb_salt + host_secret_blob + system_fingerprint
+        key_material = _key_material(pin, usb_salt, host_secret_blob, system_fingerprint)
         vault_key = crypto_manager.derive_key_argon2(key_material, usb_salt)
 
-        initial_vault_data = json.dumps({}).encode('utf-8')
+        initial_vault_data = b'{}' # json.dumps({}), encoded
         self.lock_vault(vault_key, initial_vault_data)
         
         # Log the initialization
@@ -68,27 +92,23 @@ class VaultManager:
         """
         from . import usb_manager, log_manager
         
-        with open(self.meta_file, 'r') as f:
-            metadata = json.load(f)
+        metadata, usb_salt, usb_chunks = self._read_metadata()
         
         # Verify the system fingerprint
         stored_fingerprint = bytes.fromhex(metadata['system_fingerprint_hex'])
         current_fingerprint = system_utils.get_system_fingerprint()
 
-        if stored_fingerprint != current_fingerprint:
+        if not hmac.compare_digest(stored_fingerprint, current_fingerprint):
             log_manager.add_log_entry(self.usb_path, "SECURITY: Unlock attempted on different system")
             raise PermissionError("Hardware changed! This vault is bound to a different computer.")
 
         # Verify USB signature if available
         if 'usb_signature' in metadata:
             current_usb_sig = usb_manager.get_usb_signature(self.usb_path)
-            if metadata['usb_signature'] != current_usb_sig:
+            if not usb_manager.signatures_match(metadata['usb_signature'], current_usb_sig):
                 log_manager.add_log_entry(self.usb_path, "SECURITY: USB signature mismatch - possible clone")
                 raise PermissionError("USB signature mismatch. This may be a cloned device.")
 
-        usb_salt = bytes.fromhex(metadata['salt_hex'])
-        usb_chunks = [bytes.fromhex(chunk) for chunk in metadata['usb_chunks_hex']]
-        
         num_host_chunks = chunk_manager.DEFAULT_REQUIRED_SHARES // 2
         host_chunks = chunk_manager.load_host_chunks(num_host_chunks)
 
@@ -96,7 +116,7 @@ class VaultManager:
             log_manager.add_log_entry(self.usb_path, "SECURITY: Insufficient host chunks found")
             raise PermissionError("Could not find all required host chunks. Is this the correct computer?")
 
-        all_available_shares = host_chunks + usb_chunks
+        all_available_shares = host_chunks + list(usb_chunks)
         try:
             required_shares = all_available_shares[:chunk_manager.DEFAULT_REQUIRED_SHARES]
             host_secret_blob = chunk_manager.reconstruct_master_key(required_shares)
@@ -105,13 +125,15 @@ class VaultManager:
             raise ValueError(f"Failed to reconstruct secret key. Chunks may be missing or corrupt. {e}")
             
         # Include the CURRENT fingerprint in key derivation
-        key_material = pin.encode('utf-8') + usb_salt + host_secret_blob + current_fingerprint
+        key_material = _key_material(pin, usb_salt, host_secret_blob, current_fingerprint)
         vault_key = crypto_manager.derive_key_argon2(key_material, usb_salt)
 
         try:
+            # One read for the whole file; the nonce is its first AES_NONCE_SIZE bytes
             with open(self.vault_file, 'rb') as f:
-                nonce = f.read(crypto_manager.AES_NONCE_SIZE)
-                encrypted_data = f.read()
+                vault_bytes = f.read()
+            nonce = vault_bytes[:crypto_manager.AES_NONCE_SIZE]
+            encrypted_data = vault_bytes[crypto_manager.AES_NONCE_SIZE:]
             
             decrypted_data_bytes = crypto_manager.decrypt_aes_gcm(vault_key, nonce, encrypted_data)
             vault_data = json.loads(decrypted_data_bytes.decode('utf-8'))
@@ -132,21 +154,18 @@ class VaultManager:
         from . import log_manager
         
         # Re-derive the vault key (same process as unlock)
-        with open(self.meta_file, 'r') as f:
-            metadata = json.load(f)
+        _, usb_salt, usb_chunks = self._read_metadata()
         
         system_fingerprint = system_utils.get_system_fingerprint()
-        usb_salt = bytes.fromhex(metadata['salt_hex'])
-        usb_chunks = [bytes.fromhex(chunk) for chunk in metadata['usb_chunks_hex']]
         
         num_host_chunks = chunk_manager.DEFAULT_REQUIRED_SHARES // 2
         host_chunks = chunk_manager.load_host_chunks(num_host_chunks)
         
-        all_available_shares = host_chunks + usb_chunks
+        all_available_shares = host_chunks + list(usb_chunks)
         required_shares = all_available_shares[:chunk_manager.DEFAULT_REQUIRED_SHARES]
         host_secret_blob = chunk_manager.reconstruct_master_key(required_shares)
         
-        key_material = pin.encode('utf-8') + usb_salt + host_secret_blob + system_fingerprint
+        key_material = _key_material(pin, usb_salt, host_secret_blob, system_fingerprint)
         vault_key = crypto_manager.derive_key_argon2(key_material, usb_salt)
         
         # Encrypt and save